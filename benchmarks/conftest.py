@@ -0,0 +1,229 @@
+"""Benchmark harness for feedscope hot paths.
+
+Run with ``uv run pytest benchmarks`` (or ``poe bench``). Each scenario is timed
+over several rounds against an in-process Feedbin stand-in and reports
+throughput, per-request p50/p99 latency and peak memory. Pass
+``--bench-json PATH`` to save the results for comparison between runs.
+"""
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import json
+import os
+import re
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+# Keep config, cache and the local store away from the real user directories.
+_BENCH_HOME = Path(tempfile.mkdtemp(prefix="feedscope-bench-"))
+for _variable in ("XDG_CONFIG_HOME", "XDG_CACHE_HOME", "XDG_DATA_HOME"):
+    os.environ[_variable] = str(_BENCH_HOME / _variable.lower())
+
+from platformdirs import user_config_dir
+
+from feedscope.metrics import get_request_metrics
+from mock_feedbin import MockFeedbin, MockFeedbinSettings
+
+_RESULTS: list["BenchmarkResult"] = []
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary for one benchmark scenario."""
+
+    name: str
+    rounds: int
+    operations_per_round: int
+    total_seconds: float
+    throughput: float
+    requests: int
+    p50_ms: float
+    p99_ms: float
+    peak_traced_kib: float
+    peak_rss_kib: float
+    # "scenario" when the peak was reset before the scenario ran, otherwise
+    # "process": the high-water mark of the whole run so far.
+    peak_rss_scope: str
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _reset_peak_rss() -> bool:
+    """Reset this process's peak RSS where the kernel allows it (Linux)."""
+
+    try:
+        with open("/proc/self/clear_refs", "w") as handle:
+            handle.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def _peak_rss_kib() -> float:
+    try:
+        with open("/proc/self/status") as handle:
+            match = re.search(r"^VmHWM:\s+(\d+) kB", handle.read(), re.MULTILINE)
+        if match:
+            return float(match.group(1))
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kibibytes elsewhere
+    return peak / 1024 if sys.platform == "darwin" else float(peak)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("feedscope-bench")
+    group.addoption("--bench-rounds", type=int, default=10, help="Rounds per scenario.")
+    group.addoption("--bench-latency", type=float, default=0.0, help="Simulated API latency in seconds.")
+    group.addoption(
+        "--bench-jitter", type=float, default=0.0, help="Random extra latency of up to this many seconds."
+    )
+    group.addoption(
+        "--bench-error-rate",
+        type=float,
+        default=0.0,
+        help="Share of API requests answered with HTTP 500. Scenarios that need every "
+        "request to succeed are skipped.",
+    )
+    group.addoption("--bench-json", type=Path, default=None, help="Write results to this JSON file.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "inject_errors(rate): run the scenario with this mock error rate unless "
+        "--bench-error-rate sets one",
+    )
+
+
+@pytest.fixture
+def mock_settings(request: pytest.FixtureRequest) -> MockFeedbinSettings:
+    error_rate = request.config.getoption("--bench-error-rate")
+    marker = request.node.get_closest_marker("inject_errors")
+    if marker is None and error_rate:
+        pytest.skip("scenario needs every request to succeed")
+    if marker is not None and not error_rate:
+        error_rate = marker.args[0]
+    return MockFeedbinSettings(
+        latency=request.config.getoption("--bench-latency"),
+        jitter=request.config.getoption("--bench-jitter"),
+        error_rate=error_rate,
+    )
+
+
+@pytest.fixture
+def feedbin(
+    mock_settings: MockFeedbinSettings, monkeypatch: pytest.MonkeyPatch
+) -> MockFeedbin:
+    """Start a mock Feedbin and point every command's ``get_client`` at it."""
+
+    import feedscope
+
+    server = MockFeedbin(mock_settings)
+    for module in list(sys.modules.values()):
+        name = getattr(module, "__name__", "")
+        if name.startswith(feedscope.__name__) and hasattr(module, "get_client"):
+            monkeypatch.setattr(module, "get_client", server.client)
+    return server
+
+
+@pytest.fixture
+def credentials() -> Iterator[None]:
+    config_file = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    config_file.write_text('[auth]\nemail = "bench@example.com"\npassword = "bench"\n')
+    yield
+    config_file.unlink()
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Callable[..., Any]:
+    """Time ``func`` over several rounds, pytest-benchmark style.
+
+    ``operations`` is the number of logical operations (rows, requests, ids)
+    one call performs and is used to compute throughput. Latency percentiles
+    come from the per-request samples collected by ``RequestMetrics`` during
+    the timed rounds.
+    """
+
+    rounds = request.config.getoption("--bench-rounds")
+
+    def run(func: Callable[[], Any], *, operations: int = 1) -> Any:
+        result = func()  # warm-up round, also used as the return value
+        metrics = get_request_metrics()
+        metrics.reset()
+        metrics.enabled = True
+        rss_scope = "scenario" if _reset_peak_rss() else "process"
+        samples = []
+        tracemalloc.start()
+        try:
+            for _ in range(rounds):
+                started = time.perf_counter()
+                func()
+                samples.append(time.perf_counter() - started)
+            _, peak_traced = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            metrics.enabled = False
+        peak_rss = _peak_rss_kib()
+        latencies = [sample.duration for sample in metrics.samples]
+        metrics.reset()
+
+        total = sum(samples)
+        _RESULTS.append(
+            BenchmarkResult(
+                name=request.node.name,
+                rounds=rounds,
+                operations_per_round=operations,
+                total_seconds=total,
+                throughput=operations * rounds / total if total else float("inf"),
+                requests=len(latencies),
+                p50_ms=statistics.median(latencies) * 1000 if latencies else float("nan"),
+                p99_ms=_percentile(latencies, 0.99) * 1000 if latencies else float("nan"),
+                peak_traced_kib=peak_traced / 1024,
+                peak_rss_kib=peak_rss,
+                peak_rss_scope=rss_scope,
+            )
+        )
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    if not _RESULTS:
+        return
+
+    terminalreporter.section("feedscope benchmarks")
+    terminalreporter.write_line(
+        f"{'scenario':<40} {'ops/s':>12} {'requests':>9} {'req p50 ms':>11} {'req p99 ms':>11} "
+        f"{'peak KiB':>10} {'RSS KiB':>11}"
+    )
+    for result in _RESULTS:
+        marker = "" if result.peak_rss_scope == "scenario" else "*"
+        terminalreporter.write_line(
+            f"{result.name:<40} {result.throughput:>12.1f} {result.requests:>9} "
+            f"{result.p50_ms:>11.2f} {result.p99_ms:>11.2f} {result.peak_traced_kib:>10.0f} "
+            f"{result.peak_rss_kib:>10.0f}{marker or ' '}"
+        )
+    if any(result.peak_rss_scope != "scenario" for result in _RESULTS):
+        terminalreporter.write_line(
+            "* peak RSS could not be reset here; the value is the process-wide peak so far"
+        )
+
+    output = config.getoption("--bench-json")
+    if output is not None:
+        output.write_text(json.dumps([asdict(result) for result in _RESULTS], indent=2))
+        terminalreporter.write_line(f"Results written to {output}")
@@ -0,0 +1,220 @@
+"""In-process stand-in for the Feedbin v2 API built on ``httpx.MockTransport``."""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import json
+import random
+import re
+import threading
+import time
+
+import httpx
+
+from feedscope.client import RateLimiter
+from feedscope.metrics import get_request_metrics
+
+BASE_URL = "https://api.feedbin.com"
+
+_SUBSCRIPTION_RE = re.compile(r"^/v2/subscriptions/(\d+)\.json$")
+
+_PARAGRAPH = (
+    "<p>Gorgeous new interface in this major update to a venerable audio recording "
+    "app. This is one of the best takes on the new design language I&#8217;ve seen, "
+    'see also <a href="https://example.com/review/{n}">the full review</a>.</p>'
+)
+
+
+@dataclass
+class MockFeedbinSettings:
+    """Shape of the data served and how the server misbehaves."""
+
+    subscriptions: int = 500
+    entries: int = 5_000
+    per_page: int = 100
+    paragraphs_per_entry: int = 6
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class MockFeedbin:
+    """Serve realistic subscription and entry payloads from memory.
+
+    Every handled request is counted in ``request_count`` so scenarios can
+    report request throughput alongside wall time. Each ``ids=`` request
+    bumps ``revision`` and serves entries edited for it, so repeated syncs
+    of updated entries always store a new revision.
+    """
+
+    settings: MockFeedbinSettings = field(default_factory=MockFeedbinSettings)
+    request_count: int = 0
+    revision: int = 0
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.settings.seed)
+        self._lock = threading.Lock()
+        epoch = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        self.subscriptions = [
+            {
+                "id": sub_id,
+                "created_at": (epoch + timedelta(hours=sub_id)).isoformat(),
+                "feed_id": sub_id + 1000,
+                "title": f"Example Feed {sub_id}",
+                "feed_url": f"https://feed{sub_id}.example.com/index.xml",
+                "site_url": f"https://feed{sub_id}.example.com/",
+            }
+            for sub_id in range(1, self.settings.subscriptions + 1)
+        ]
+        self.entries = [
+            {
+                "id": entry_id,
+                "feed_id": 1000 + (entry_id % max(self.settings.subscriptions, 1)) + 1,
+                "title": f"Entry {entry_id}",
+                "url": f"https://example.com/posts/{entry_id}",
+                "extracted_content_url": f"https://extract.feedbin.com/parser/feedbin/{entry_id:040x}",
+                "author": "Example Author",
+                "content": "\n".join(
+                    _PARAGRAPH.format(n=entry_id * 10 + n)
+                    for n in range(self.settings.paragraphs_per_entry)
+                ),
+                "summary": "One of the best takes on the new design language.",
+                "published": (epoch + timedelta(minutes=entry_id)).isoformat(),
+                "created_at": (epoch + timedelta(minutes=entry_id, seconds=5)).isoformat(),
+            }
+            for entry_id in range(self.settings.entries, 0, -1)
+        ]
+        self._entries_by_id = {entry["id"]: entry for entry in self.entries}
+        self.unread_ids = set(self._entries_by_id)
+        self.updated_ids = sorted(self._entries_by_id)[: min(500, len(self.entries))]
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self, requests_per_second: float | None = None) -> httpx.Client:
+        """Return a client wired to this server, with the same hooks as ``get_client()``."""
+
+        metrics = get_request_metrics()
+        request_hooks = [metrics.on_request]
+        if requests_per_second:
+            request_hooks.insert(0, RateLimiter(requests_per_second).wait)
+        return httpx.Client(
+            transport=self.transport(),
+            event_hooks={"request": request_hooks, "response": [metrics.on_response]},
+        )
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.request_count += 1
+            roll = self._random.random()
+            delay = self.settings.latency + self._random.uniform(0, self.settings.jitter)
+
+        if delay:
+            time.sleep(delay)
+        if roll < self.settings.error_rate:
+            return httpx.Response(500, json={"status": 500, "error": "Internal Server Error"})
+
+        path = request.url.path
+        method = request.method
+
+        if path == "/v2/authentication.json":
+            return httpx.Response(200)
+        if path == "/v2/subscriptions.json" and method == "GET":
+            return self._subscriptions(request)
+        if match := _SUBSCRIPTION_RE.match(path):
+            return self._subscription(int(match.group(1)), request)
+        if path == "/v2/entries.json":
+            return self._entries(request)
+        if path == "/v2/unread_entries.json":
+            return self._unread(request)
+        if path == "/v2/updated_entries.json":
+            return httpx.Response(200, json=self.updated_ids)
+        return httpx.Response(404)
+
+    def _subscriptions(self, request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("mode") == "extended":
+            return httpx.Response(200, json=[self._extended(sub) for sub in self.subscriptions])
+        return httpx.Response(200, json=self.subscriptions)
+
+    def _subscription(self, sub_id: int, request: httpx.Request) -> httpx.Response:
+        if not 1 <= sub_id <= len(self.subscriptions):
+            return httpx.Response(403)
+        sub = self.subscriptions[sub_id - 1]
+        if request.url.params.get("mode") == "extended":
+            sub = self._extended(sub)
+        return httpx.Response(200, json=sub)
+
+    @staticmethod
+    def _extended(sub: dict) -> dict:
+        return {
+            **sub,
+            "json_feed": {
+                "favicon": f"{sub['site_url']}favicon.png",
+                "feed_url": sub["feed_url"],
+                "version": "https://jsonfeed.org/version/1",
+                "home_page_url": sub["site_url"],
+                "title": sub["title"],
+            },
+        }
+
+    def _entries(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if "ids" in params:
+            ids = [int(value) for value in params["ids"].split(",") if value]
+            if len(ids) > 100:
+                return httpx.Response(400)
+            with self._lock:
+                self.revision += 1
+                revision = self.revision
+            entries = [self._entries_by_id[i] for i in ids if i in self._entries_by_id]
+            if params.get("include_original") == "true":
+                entries = [
+                    {
+                        **self._revised(entry, revision),
+                        "original": {"title": entry["title"], "content": entry["content"][:200]},
+                    }
+                    for entry in entries
+                ]
+            else:
+                entries = [self._revised(entry, revision) for entry in entries]
+            return httpx.Response(200, json=entries)
+
+        per_page = min(int(params.get("per_page", self.settings.per_page)), 100)
+        page = int(params.get("page", 1))
+        last_page = max(1, -(-len(self.entries) // per_page))
+        start = (page - 1) * per_page
+        headers = {"X-Total-Count": str(len(self.entries))}
+        links = []
+        if page < last_page:
+            links.append(f'<{BASE_URL}/v2/entries.json?page={page + 1}&per_page={per_page}>; rel="next"')
+        links.append(f'<{BASE_URL}/v2/entries.json?page={last_page}&per_page={per_page}>; rel="last"')
+        headers["Link"] = ", ".join(links)
+        return httpx.Response(200, json=self.entries[start : start + per_page], headers=headers)
+
+    def _revised(self, entry: dict, revision: int) -> dict:
+        """Return ``entry`` with one paragraph edited for ``revision``."""
+
+        paragraphs = entry["content"].split("\n")
+        index = revision % len(paragraphs)
+        paragraphs[index] = paragraphs[index].replace(
+            "venerable audio", f"venerable (revision {revision}) audio"
+        )
+        return {**entry, "content": "\n".join(paragraphs)}
+
+    def _unread(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json=sorted(self.unread_ids))
+
+        ids = json.loads(request.content or b"{}").get("unread_entries", [])
+        if len(ids) > 1000:
+            return httpx.Response(400)
+        with self._lock:
+            if request.method == "DELETE":
+                changed = [i for i in ids if i in self.unread_ids]
+                self.unread_ids.difference_update(changed)
+            else:
+                changed = [i for i in ids if i in self._entries_by_id]
+                self.unread_ids.update(changed)
+        return httpx.Response(200, json=changed)
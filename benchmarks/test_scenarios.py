@@ -0,0 +1,141 @@
+"""Hot-path scenarios timed against the mock Feedbin server."""
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from feedscope import app
+from feedscope.cassette import Cassette, RecordingTransport
+from mock_feedbin import MockFeedbin
+
+runner = CliRunner()
+
+
+def _invoke(args: list[str]) -> str:
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    return result.stdout
+
+
+def test_subscriptions_list_jsonl(bench, feedbin, credentials) -> None:
+    output = bench(
+        lambda: _invoke(["subscriptions", "list", "--jsonl"]),
+        operations=len(feedbin.subscriptions),
+    )
+    assert len(output.splitlines()) == len(feedbin.subscriptions)
+
+
+def test_subscriptions_list_extended(bench, feedbin, credentials) -> None:
+    bench(
+        lambda: _invoke(["subscriptions", "list", "--extended"]),
+        operations=len(feedbin.subscriptions),
+    )
+
+
+def test_subscriptions_get(bench, feedbin, credentials) -> None:
+    ids = [str(sub_id) for sub_id in range(1, 51)]
+    output = bench(lambda: _invoke(["subscriptions", "get", *ids]), operations=len(ids))
+    assert output.count('"feed_url"') == len(ids)
+
+
+def test_paginated_entry_export(bench, feedbin, credentials) -> None:
+    """``entries export`` following ``Link: rel="next"`` through every page."""
+
+    output = bench(
+        lambda: _invoke(["entries", "export"]), operations=len(feedbin.entries)
+    )
+    assert len(output.splitlines()) == len(feedbin.entries)
+
+
+def test_updated_id_hydration(bench, feedbin, credentials) -> None:
+    """Resolve updated entry IDs into full entries and store their revisions."""
+
+    output = bench(
+        lambda: _invoke(["updated", "sync"]), operations=len(feedbin.updated_ids)
+    )
+    # The mock edits entries on every request, so each round stores deltas
+    count = len(feedbin.updated_ids)
+    assert f"Synced {count} updated entries ({count} new revisions)" in output
+
+
+def test_mock_bulk_mark_read_baseline(bench, feedbin) -> None:
+    """Baseline of the mock server itself: no feedscope command marks entries yet.
+
+    Marks every unread entry as read in 1,000-id requests, then restores them,
+    to show how much of other scenarios' time the mock accounts for.
+    """
+
+    all_ids = sorted(feedbin.unread_ids)
+
+    def mark(method: str) -> None:
+        with feedbin.client() as client:
+            for start in range(0, len(all_ids), 1000):
+                response = client.request(
+                    method,
+                    "https://api.feedbin.com/v2/unread_entries.json",
+                    json={"unread_entries": all_ids[start : start + 1000]},
+                    auth=("bench@example.com", "bench"),
+                )
+                assert response.status_code == 200
+
+    def round_trip() -> None:
+        mark("DELETE")
+        mark("POST")
+
+    bench(round_trip, operations=2 * len(all_ids))
+    assert feedbin.unread_ids == set(all_ids)
+
+
+def test_account_sync(bench, feedbin, credentials) -> None:
+    """Full single-account sync: subscriptions, every entry page and updated entries."""
+
+    output = bench(
+        lambda: _invoke(["sync", "--workers", "1", "--rate", "0"]),
+        operations=len(feedbin.entries),
+    )
+    assert "Synced 1/1 accounts" in output
+
+
+@pytest.mark.inject_errors(0.01)
+def test_account_sync_with_errors(bench, feedbin, credentials) -> None:
+    """Account sync against a server failing a share of requests with HTTP 500.
+
+    A failed request ends that round's sync early, so throughput is in sync
+    attempts rather than entries.
+    """
+
+    def sync() -> str:
+        result = runner.invoke(app, ["sync", "--workers", "1", "--rate", "0"])
+        assert "accounts with 1 worker(s)" in result.stdout, result.output
+        return result.stdout
+
+    bench(sync)
+    assert feedbin.request_count > 0
+
+
+def test_replayed_subscriptions_list(bench, credentials, tmp_path) -> None:
+    """The real get_client() path answering from a recorded cassette."""
+
+    server = MockFeedbin()
+    cassette_path = tmp_path / "feedbin.cassette"
+    transport = RecordingTransport(Cassette(cassette_path), transport=server.transport())
+    with httpx.Client(transport=transport) as client:
+        client.get(
+            "https://api.feedbin.com/v2/subscriptions.json",
+            auth=("bench@example.com", "bench"),
+        )
+
+    output = bench(
+        lambda: _invoke(["--replay", str(cassette_path), "subscriptions", "list", "--jsonl"]),
+        operations=len(server.subscriptions),
+    )
+    assert len(output.splitlines()) == len(server.subscriptions)
+
+
+def test_entry_export_with_text_transforms(bench, feedbin, credentials) -> None:
+    """Paginated export with HTML-to-text, link and word-count transforms."""
+
+    output = bench(
+        lambda: _invoke(["entries", "export", "--text", "--links", "--word-count"]),
+        operations=len(feedbin.entries),
+    )
+    assert len(output.splitlines()) == len(feedbin.entries)
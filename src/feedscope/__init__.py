@@ -7,10 +7,19 @@ from loguru import logger
 from loguru_config import LoguruConfig
 from typing_extensions import Annotated
 
+from .accounts import accounts_app
 from .auth import auth_app
+from .cassette import use_cassette
 from .config_cli import config_app
+from .entries import entries_app
+from .metrics import get_request_metrics
+from .profiling import ProfileMode, start_profile
+from .server import serve
+from .snapshots import snapshots_app
 from .state import AppState
 from .subscriptions import subscriptions_app
+from .sync import sync_accounts
+from .updated import updated_app
 
 
 def configure_logging(config_file: Path | None) -> AppState:
@@ -40,8 +49,14 @@ def configure_logging(config_file: Path | None) -> AppState:
 
 app = typer.Typer(help="Feedscope - CLI for working with Feedbin API content")
 app.add_typer(auth_app, name="auth")
+app.add_typer(accounts_app, name="accounts")
 app.add_typer(config_app, name="config")
+app.add_typer(entries_app, name="entries")
+app.add_typer(snapshots_app, name="snapshots")
 app.add_typer(subscriptions_app, name="subscriptions")
+app.add_typer(updated_app, name="updated")
+app.command(name="sync")(sync_accounts)
+app.command(name="serve")(serve)
 
 
 @app.callback()
@@ -58,8 +73,81 @@ def root(
             resolve_path=True,
         ),
     ] = None,
+    metrics_out: Annotated[
+        Path | None,
+        typer.Option(
+            "--metrics-out",
+            help="Write a request metrics summary here at exit (Prometheus text for .prom, JSON otherwise)",
+            dir_okay=False,
+            writable=True,
+            resolve_path=True,
+        ),
+    ] = None,
+    profile: Annotated[
+        ProfileMode | None,
+        typer.Option(
+            "--profile",
+            help="Profile the command and write an artifact (pstats, allocation report or collapsed stacks)",
+            case_sensitive=False,
+        ),
+    ] = None,
+    profile_dir: Annotated[
+        Path,
+        typer.Option(
+            "--profile-dir",
+            help="Directory for profile artifacts",
+            file_okay=False,
+            resolve_path=True,
+        ),
+    ] = Path("."),
+    record: Annotated[
+        Path | None,
+        typer.Option(
+            "--record",
+            help="Record API traffic (credentials scrubbed) to this cassette file",
+            dir_okay=False,
+            resolve_path=True,
+        ),
+    ] = None,
+    replay: Annotated[
+        Path | None,
+        typer.Option(
+            "--replay",
+            help="Answer API requests from this cassette file instead of the network",
+            exists=True,
+            dir_okay=False,
+            resolve_path=True,
+        ),
+    ] = None,
+    replay_latency: Annotated[
+        str,
+        typer.Option(
+            "--replay-latency",
+            help="Delay per replayed request: seconds, or 'recorded' for the original timings",
+        ),
+    ] = "0",
 ) -> None:
-    ctx.obj = configure_logging(log_config)
+    state = configure_logging(log_config)
+
+    if record is not None or replay is not None:
+        use_cassette(ctx, record=record, replay=replay, latency=replay_latency)
+
+    state.metrics_out = metrics_out
+    ctx.obj = state
+
+    if metrics_out is not None:
+        metrics = get_request_metrics()
+        metrics.reset()
+        metrics.enabled = True
+
+        def write_metrics() -> None:
+            metrics.write(metrics_out)
+            metrics.enabled = False
+
+        ctx.call_on_close(write_metrics)
+
+    if profile is not None:
+        start_profile(ctx, profile, profile_dir)
 
 
 def main() -> None:
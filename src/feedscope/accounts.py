@@ -0,0 +1,104 @@
+import typer
+import httpx
+from typing_extensions import Annotated
+from rich.prompt import Prompt
+from loguru import logger
+
+from .config import DEFAULT_ACCOUNT, AuthCredentials, get_config, is_valid_account_name
+from .client import get_client
+from .state import get_state
+
+accounts_app = typer.Typer(help="Manage additional Feedbin accounts for multi-account sync")
+
+
+@accounts_app.command()
+def add(
+    ctx: typer.Context,
+    name: Annotated[str, typer.Argument(help="Short name for the account")],
+    email: Annotated[str, typer.Argument(help="Feedbin email address")],
+    password: Annotated[str, typer.Option("--password", "-p", help="Feedbin password", hide_input=True)] = None,
+) -> None:
+    """Verify and store credentials for a named account."""
+    state = get_state(ctx)
+    logger.debug("Adding account {} with log config {}", name, state.log_config_path)
+
+    if not is_valid_account_name(name):
+        typer.echo(
+            f"❌ Invalid account name '{name}': use only letters, digits, '-' and '_'.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    if name == DEFAULT_ACCOUNT:
+        typer.echo(
+            f"❌ '{DEFAULT_ACCOUNT}' refers to the `feedscope auth login` account.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    config = get_config()
+
+    if password is None:
+        password = Prompt.ask("Enter the Feedbin password", password=True)
+
+    url = "https://api.feedbin.com/v2/authentication.json"
+
+    try:
+        with get_client() as client:
+            response = client.get(url, auth=(email, password))
+    except httpx.RequestError as e:
+        typer.echo(f"❌ Network error: {e}", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if response.status_code == 401:
+        typer.echo(
+            "❌ Authentication failed - invalid credentials", color=typer.colors.RED
+        )
+        raise typer.Exit(1)
+    elif response.status_code != 200:
+        typer.echo(
+            f"❌ Unexpected response: {response.status_code}", color=typer.colors.RED
+        )
+        raise typer.Exit(1)
+
+    config.accounts[name] = AuthCredentials(email=email, password=password)
+    config.save()
+    typer.echo(
+        f"✅ Account '{name}' saved to {config.config_file_path}",
+        color=typer.colors.GREEN,
+    )
+
+
+@accounts_app.command(name="list")
+def list_accounts(ctx: typer.Context) -> None:
+    """List accounts that `feedscope sync` can use."""
+    state = get_state(ctx)
+    logger.debug("Listing accounts with log config {}", state.log_config_path)
+    config = get_config()
+
+    accounts = config.all_accounts()
+    if not accounts:
+        typer.echo("No accounts configured.", color=typer.colors.YELLOW)
+        return
+
+    for name, creds in accounts.items():
+        typer.echo(f"{name}: {creds.email}")
+
+
+@accounts_app.command()
+def remove(
+    ctx: typer.Context,
+    name: Annotated[str, typer.Argument(help="Name of the account to remove")],
+) -> None:
+    """Remove a named account's credentials."""
+    state = get_state(ctx)
+    logger.debug("Removing account {} with log config {}", name, state.log_config_path)
+    config = get_config()
+
+    if name not in config.accounts:
+        typer.echo(f"❌ No account named '{name}'", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    del config.accounts[name]
+    config.save()
+    typer.echo(f"✅ Account '{name}' removed", color=typer.colors.GREEN)
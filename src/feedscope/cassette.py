@@ -0,0 +1,238 @@
+"""Record real API traffic to a cassette file and replay it offline."""
+
+from hashlib import sha256
+from pathlib import Path
+import base64
+import binascii
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+import httpx
+import typer
+from loguru import logger
+
+# Read by get_client(). Environment variables rather than module state so that
+# worker processes started by `feedscope sync` use the same cassette.
+RECORD_ENV = "FEEDSCOPE_RECORD"
+REPLAY_ENV = "FEEDSCOPE_REPLAY"
+REPLAY_LATENCY_ENV = "FEEDSCOPE_REPLAY_LATENCY"
+
+# Never persist credentials or session state.
+SCRUBBED_HEADERS = frozenset({"authorization", "cookie", "set-cookie", "proxy-authorization"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    key TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (key, seq)
+);
+"""
+
+
+def account_tag(request: httpx.Request) -> str:
+    """Return a non-reversible tag for the Basic auth user of a request."""
+
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "basic" or not credentials:
+        return ""
+    try:
+        username = base64.b64decode(credentials).decode().partition(":")[0]
+    except (binascii.Error, UnicodeDecodeError):
+        return ""
+    return sha256(username.encode()).hexdigest()[:12]
+
+
+def interaction_key(request: httpx.Request) -> str:
+    """Identify a request by account, method, URL with sorted query and body digest.
+
+    The account tag keeps identical requests made by different accounts on
+    separate replay sequences without storing the credentials themselves.
+    """
+
+    url = request.url.copy_with(query=None)
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.url.params.multi_items()))
+    body = sha256(request.content).hexdigest()[:16] if request.content else ""
+    return f"{account_tag(request)} {request.method} {url}?{query} {body}"
+
+
+class Cassette:
+    """An indexed SQLite file of scrubbed request/response pairs.
+
+    Repeated identical requests are stored in order and replayed in the same
+    order; once exhausted, the last recorded response keeps being returned.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+        self._replayed: dict[str, int] = {}
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    def record(self, request: httpx.Request, response: httpx.Response, duration: float) -> None:
+        key = interaction_key(request)
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in SCRUBBED_HEADERS
+            # the body is stored decoded, so encoding headers no longer apply
+            and name.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+        ]
+        with self.connection:
+            (seq,) = self.connection.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM interactions WHERE key = ?", (key,)
+            ).fetchone()
+            self.connection.execute(
+                "INSERT INTO interactions (key, seq, method, url, status, headers, body, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    seq,
+                    request.method,
+                    str(request.url),
+                    response.status_code,
+                    json.dumps(headers),
+                    zlib.compress(response.content),
+                    duration,
+                ),
+            )
+
+    def lookup(self, request: httpx.Request) -> tuple[int, list[tuple[str, str]], bytes, float] | None:
+        """Return ``(status, headers, body, duration)`` for the next matching recording."""
+
+        key = interaction_key(request)
+        seq = self._replayed.get(key, 0)
+        row = self.connection.execute(
+            "SELECT status, headers, body, duration FROM interactions "
+            "WHERE key = ? AND seq <= ? ORDER BY seq DESC LIMIT 1",
+            (key, seq),
+        ).fetchone()
+        if row is None:
+            return None
+        self._replayed[key] = seq + 1
+        status, headers, body, duration = row
+        return status, [tuple(pair) for pair in json.loads(headers)], zlib.decompress(body), duration
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Pass requests to a real transport and save each exchange to a cassette."""
+
+    def __init__(self, cassette: Cassette, transport: httpx.BaseTransport | None = None) -> None:
+        self.cassette = cassette
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = self.transport.handle_request(request)
+        content = response.read()
+        duration = time.perf_counter() - started
+        response.close()
+        self.cassette.record(request, response, duration)
+        return httpx.Response(
+            response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+            ],
+            content=content,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self.transport.close()
+        self.cassette.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Answer requests from a cassette without touching the network.
+
+    ``latency`` is a fixed delay in seconds per request, or ``"recorded"`` to
+    reproduce the duration observed while recording.
+    """
+
+    def __init__(self, cassette: Cassette, latency: float | str = 0.0) -> None:
+        self.cassette = cassette
+        self.latency = latency
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        recorded = self.cassette.lookup(request)
+        if recorded is None:
+            logger.debug("No recorded response for {}", interaction_key(request))
+            raise httpx.ConnectError(
+                f"No recorded response for {request.method} {request.url} in {self.cassette.path}",
+                request=request,
+            )
+
+        status, headers, body, duration = recorded
+        delay = duration if self.latency == "recorded" else float(self.latency)
+        if delay:
+            time.sleep(delay)
+        return httpx.Response(status, headers=headers, content=body)
+
+    def close(self) -> None:
+        self.cassette.close()
+
+
+def parse_latency(value: str) -> float | str:
+    """Parse a ``--replay-latency`` value: seconds or ``recorded``."""
+
+    if value == "recorded":
+        return value
+    return float(value)
+
+
+def use_cassette(
+    ctx: typer.Context,
+    *,
+    record: Path | None = None,
+    replay: Path | None = None,
+    latency: str = "0",
+) -> None:
+    """Route this invocation's API clients through a cassette until it closes."""
+
+    if record is not None and replay is not None:
+        typer.echo("❌ --record and --replay cannot be combined", err=True)
+        raise typer.Exit(1)
+    try:
+        parse_latency(latency)
+    except ValueError:
+        typer.echo(
+            f"❌ Invalid --replay-latency {latency!r}: use seconds or 'recorded'",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    if record is not None:
+        settings = {RECORD_ENV: str(record)}
+    else:
+        settings = {REPLAY_ENV: str(replay), REPLAY_LATENCY_ENV: latency}
+    previous = {name: os.environ.get(name) for name in settings}
+    os.environ.update(settings)
+    logger.debug("Using cassette settings {}", settings)
+
+    def restore() -> None:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    ctx.call_on_close(restore)
@@ -1,10 +1,65 @@
+import os
+import threading
+import time
+
 import httpx
 from hishel import CacheClient, FileStorage
 from platformdirs import user_cache_dir
 from pathlib import Path
 
-def get_client() -> httpx.Client:
-    """Get a cached httpx client."""
+from .cassette import (
+    RECORD_ENV,
+    REPLAY_ENV,
+    REPLAY_LATENCY_ENV,
+    Cassette,
+    RecordingTransport,
+    ReplayTransport,
+    parse_latency,
+)
+from .metrics import get_request_metrics
+
+
+class RateLimiter:
+    """Space requests so a client stays within a requests-per-second budget."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.interval = 1.0 / requests_per_second
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self, request: httpx.Request) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def get_client(requests_per_second: float | None = None) -> httpx.Client:
+    """Get a cached httpx client that records per-request metrics.
+
+    When ``requests_per_second`` is given, requests made through the client
+    are spaced to stay within that budget. When a cassette is configured the
+    HTTP cache is bypassed and traffic is recorded to, or replayed from, it.
+    """
+    metrics = get_request_metrics()
+    request_hooks = [metrics.on_request]
+    if requests_per_second:
+        request_hooks.insert(0, RateLimiter(requests_per_second).wait)
+    event_hooks = {
+        "request": request_hooks,
+        "response": [metrics.on_response],
+    }
+
+    if replay := os.environ.get(REPLAY_ENV):
+        latency = parse_latency(os.environ.get(REPLAY_LATENCY_ENV, "0"))
+        transport = ReplayTransport(Cassette(Path(replay)), latency=latency)
+        return httpx.Client(transport=transport, event_hooks=event_hooks)
+    if record := os.environ.get(RECORD_ENV):
+        transport = RecordingTransport(Cassette(Path(record)))
+        return httpx.Client(transport=transport, event_hooks=event_hooks)
+
     cache_dir = Path(user_cache_dir("dev.pirateninja.feedscope", "http-cache"))
     storage = FileStorage(base_path=cache_dir)
-    return CacheClient(storage=storage)
+    return CacheClient(storage=storage, event_hooks=event_hooks)
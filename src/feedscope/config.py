@@ -8,9 +8,23 @@ from pydantic_settings import (
 
 from platformdirs import user_config_dir
 from pathlib import Path
+import re
 import tomlkit
 
 
+# Name under which the top-level ``[auth]`` credentials are addressed
+DEFAULT_ACCOUNT = "default"
+
+# Account names become store file names, so keep them to one safe path part
+ACCOUNT_NAME_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def is_valid_account_name(name: str) -> bool:
+    """Return whether ``name`` can be used as an account name."""
+
+    return ACCOUNT_NAME_PATTERN.fullmatch(name) is not None
+
+
 class AuthCredentials(BaseModel):
     """Authentication credentials."""
 
@@ -24,6 +38,7 @@ class FeedscopeConfig(BaseSettings):
     )
 
     auth: AuthCredentials = AuthCredentials()
+    accounts: dict[str, AuthCredentials] = {}
 
     @classmethod
     def settings_customise_sources(
@@ -41,6 +56,18 @@ class FeedscopeConfig(BaseSettings):
         """Load configuration from file."""
         return cls()
 
+    def all_accounts(self) -> dict[str, AuthCredentials]:
+        """Return every account with credentials, the ``[auth]`` one as ``default``."""
+        accounts = {}
+        if self.auth.email and self.auth.password:
+            accounts[DEFAULT_ACCOUNT] = self.auth
+        accounts.update(
+            (name, creds)
+            for name, creds in self.accounts.items()
+            if creds.email and creds.password
+        )
+        return accounts
+
     @property
     def config_file_path(self) -> Path:
         """Get the path to the configuration file."""
@@ -65,6 +92,14 @@ class FeedscopeConfig(BaseSettings):
         doc["auth"]["email"] = self.auth.email
         doc["auth"]["password"] = self.auth.password
 
+        if self.accounts:
+            accounts = tomlkit.table()
+            for name, creds in self.accounts.items():
+                accounts[name] = {"email": creds.email, "password": creds.password}
+            doc["accounts"] = accounts
+        elif "accounts" in doc:
+            del doc["accounts"]
+
         if "email" in doc:
             del doc["email"]
         if "password" in doc:
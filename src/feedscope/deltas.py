@@ -0,0 +1,226 @@
+"""Compact content deltas for storing successive entry revisions."""
+
+import bisect
+import difflib
+import json
+import re
+import zlib
+
+# Split HTML into whitespace runs, whole tags and word runs so edits to a
+# single paragraph only touch the tokens that actually changed.
+_TOKEN_RE = re.compile(r"\s+|<[^>]*>|[^\s<]+|<")
+
+# Blocks end at a newline or a closing block-level tag; the final alternative
+# picks up a trailing block without either.
+_BLOCK_RE = re.compile(
+    r".*?(?:</(?:p|div|li|h[1-6]|blockquote|pre|tr|table|ul|ol|section|article|figure)\s*>\n?|\n)|.+",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# SequenceMatcher can approach len(a) * len(b) work on repetitive input.
+# Spans between anchors with more token pairs than this are stored as
+# inserted text instead of being diffed, which keeps the total linear.
+MAX_DIFF_CELLS = 250_000
+
+Delta = list[list[int] | str]
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text)
+
+
+def _split_blocks(text: str) -> list[str]:
+    return _BLOCK_RE.findall(text)
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    # Binary search on slice equality keeps the comparisons in C
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str) -> int:
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle :] == b[len(b) - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _copy(ops: Delta, start: int, end: int) -> None:
+    if start == end:
+        return
+    previous = ops[-1] if ops else None
+    if isinstance(previous, list) and previous[1] == start:
+        previous[1] = end
+    else:
+        ops.append([start, end])
+
+
+def _insert(ops: Delta, text: str) -> None:
+    if not text:
+        return
+    if ops and isinstance(ops[-1], str):
+        ops[-1] += text
+    else:
+        ops.append(text)
+
+
+def _diff_span(ops: Delta, base: int, old: str, new: str) -> None:
+    """Token-diff one changed block span, or insert it whole if too large."""
+
+    if not old:
+        _insert(ops, new)
+        return
+    old_tokens = _tokenize(old)
+    new_tokens = _tokenize(new)
+    if not new_tokens or len(old_tokens) * len(new_tokens) > MAX_DIFF_CELLS:
+        _insert(ops, new)
+        return
+
+    offsets = [base]
+    for token in old_tokens:
+        offsets.append(offsets[-1] + len(token))
+    # Whitespace runs repeat everywhere; never start a match on one
+    matcher = difflib.SequenceMatcher(str.isspace, old_tokens, new_tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            _copy(ops, offsets[i1], offsets[i2])
+        elif tag in ("replace", "insert"):
+            _insert(ops, "".join(new_tokens[j1:j2]))
+
+
+def _unique_anchors(old_blocks: list[str], new_blocks: list[str]) -> list[tuple[int, int]]:
+    """Pair blocks that occur exactly once on each side, in increasing order.
+
+    Repeated blocks never anchor anything, so a page of identical paragraphs
+    cannot send the diff quadratic. The longest run of pairs that appear in
+    the same order on both sides is kept (patience sorting).
+    """
+
+    counts: dict[str, list[int]] = {}
+    for index, block in enumerate(old_blocks):
+        counts.setdefault(block, [0, 0, index])[0] += 1
+    for block in new_blocks:
+        if block in counts:
+            counts[block][1] += 1
+    pairs = [
+        (counts[block][2], j)
+        for j, block in enumerate(new_blocks)
+        if block in counts and counts[block][:2] == [1, 1]
+    ]
+    pairs.sort()
+
+    tails: list[int] = []
+    tail_pairs: list[int] = []
+    links: list[int] = []
+    for index, (_, j) in enumerate(pairs):
+        position = bisect.bisect_left(tails, j)
+        links.append(tail_pairs[position - 1] if position else -1)
+        if position == len(tails):
+            tails.append(j)
+            tail_pairs.append(index)
+        else:
+            tails[position] = j
+            tail_pairs[position] = index
+
+    anchors = []
+    index = tail_pairs[-1] if tail_pairs else -1
+    while index >= 0:
+        anchors.append(pairs[index])
+        index = links[index]
+    anchors.reverse()
+    return anchors
+
+
+def compute_delta(old: str, new: str) -> Delta:
+    """Describe ``new`` as copies from ``old`` plus inserted text.
+
+    Each operation is either a ``[start, end]`` character range to copy from
+    ``old`` or a literal string to insert. The unchanged prefix and suffix
+    are copied directly, the rest is split into blocks (lines and closing
+    block tags) anchored on blocks unique to both sides, and only the spans
+    between anchors are diffed token by token. Spans over
+    :data:`MAX_DIFF_CELLS` are stored as inserted text, so the cost stays
+    bounded however large or repetitive the input is.
+    """
+
+    ops: Delta = []
+    prefix = _common_prefix_length(old, new)
+    suffix = _common_suffix_length(old[prefix:], new[prefix:])
+    old_middle = old[prefix : len(old) - suffix]
+    new_middle = new[prefix : len(new) - suffix]
+
+    _copy(ops, 0, prefix)
+    if old_middle and new_middle:
+        old_blocks = _split_blocks(old_middle)
+        new_blocks = _split_blocks(new_middle)
+        offsets = [prefix]
+        for block in old_blocks:
+            offsets.append(offsets[-1] + len(block))
+
+        i = j = 0
+        anchors = _unique_anchors(old_blocks, new_blocks)
+        for anchor_i, anchor_j in anchors + [(len(old_blocks), len(new_blocks))]:
+            # Equal blocks next to an anchor extend it without any diffing
+            while i < anchor_i and j < anchor_j and old_blocks[i] == new_blocks[j]:
+                _copy(ops, offsets[i], offsets[i + 1])
+                i += 1
+                j += 1
+            tail = 0
+            while (
+                tail < min(anchor_i - i, anchor_j - j)
+                and old_blocks[anchor_i - tail - 1] == new_blocks[anchor_j - tail - 1]
+            ):
+                tail += 1
+            _diff_span(
+                ops,
+                offsets[i],
+                "".join(old_blocks[i : anchor_i - tail]),
+                "".join(new_blocks[j : anchor_j - tail]),
+            )
+            _copy(ops, offsets[anchor_i - tail], offsets[min(anchor_i + 1, len(old_blocks))])
+            i, j = anchor_i + 1, anchor_j + 1
+    else:
+        _insert(ops, new_middle)
+    _copy(ops, len(old) - suffix, len(old))
+    return ops
+
+
+def apply_delta(old: str, delta: Delta) -> str:
+    """Rebuild the newer text from ``old`` and a delta from :func:`compute_delta`."""
+
+    return "".join(old[op[0] : op[1]] if isinstance(op, list) else op for op in delta)
+
+
+def encode_text(text: str) -> bytes:
+    """Compress a full text snapshot for storage."""
+
+    return zlib.compress(text.encode("utf-8"))
+
+
+def decode_text(payload: bytes) -> str:
+    """Decompress a snapshot produced by :func:`encode_text`."""
+
+    return zlib.decompress(payload).decode("utf-8")
+
+
+def encode_delta(delta: Delta) -> bytes:
+    """Serialize and compress a delta for storage."""
+
+    return encode_text(json.dumps(delta, separators=(",", ":"), ensure_ascii=False))
+
+
+def decode_delta(payload: bytes) -> Delta:
+    """Inverse of :func:`encode_delta`."""
+
+    return json.loads(decode_text(payload))
@@ -0,0 +1,162 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Callable
+import json
+import os
+
+import typer
+import httpx
+from typing_extensions import Annotated
+from loguru import logger
+
+from .config import get_config
+from .client import get_client
+from .htmltext import transform_entries
+from .output import Compression, CompressionOption, OutputOption, open_output
+from .state import get_state
+
+entries_app = typer.Typer(help="Export feed entries", invoke_without_command=True)
+
+ENTRIES_URL = "https://api.feedbin.com/v2/entries.json"
+PER_PAGE = 100
+
+
+@entries_app.callback()
+def entries(ctx: typer.Context):
+    """
+    Export feed entries.
+    """
+    get_state(ctx)
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+
+def _drain(pending: deque[Future], write: Callable[[list[dict]], None], max_pending: int) -> None:
+    """Write finished pages in order, waiting only while too many are queued.
+
+    Blocking on just the oldest page keeps the workers busy with the rest of
+    the queue while the next page is fetched.
+    """
+
+    while len(pending) > max_pending:
+        write(pending.popleft().result())
+    while pending and pending[0].done():
+        write(pending.popleft().result())
+
+
+@entries_app.command(name="export", help="Export entries as JSON lines.")
+def export_entries(
+    ctx: typer.Context,
+    since: Annotated[
+        str,
+        typer.Option(
+            "--since",
+            help="Only include entries created after this ISO 8601 timestamp.",
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        typer.Option(
+            "--limit",
+            "-l",
+            help="Stop after this many entries.",
+            min=1,
+        ),
+    ] = None,
+    text: Annotated[
+        bool,
+        typer.Option("--text", help="Add a plain-text rendering of the content."),
+    ] = False,
+    links: Annotated[
+        bool,
+        typer.Option("--links", help="Add the outbound links found in the content."),
+    ] = False,
+    word_count: Annotated[
+        bool,
+        typer.Option("--word-count", help="Add the number of words in the content."),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Worker processes for content transforms. Defaults to one per CPU.",
+            min=1,
+        ),
+    ] = None,
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
+) -> None:
+    """Pages through all entries, optionally deriving text, links and word counts."""
+    state = get_state(ctx)
+    logger.debug("Exporting entries with log config {}", state.log_config_path)
+    config = get_config()
+
+    if not config.auth.email or not config.auth.password:
+        typer.echo(
+            "❌ Authentication credentials not found. Please run `feedscope auth login` first.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    auth = (config.auth.email, config.auth.password)
+    transform = None
+    if text or links or word_count:
+        transform = partial(transform_entries, text=text, links=links, word_count=word_count)
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if transform and workers > 1 else None
+    # Pages handed to the pool, written in order as they finish. The bound
+    # keeps a fast API from queueing unbounded work behind slow parsing.
+    pending: deque[Future] = deque()
+    exported = 0
+
+    try:
+        with get_client() as client, open_output(output, compress) as writer:
+
+            def write(batch: list[dict]) -> None:
+                for entry in batch:
+                    writer.write_line(json.dumps(entry))
+
+            url: str | None = ENTRIES_URL
+            params: dict | None = {"per_page": PER_PAGE}
+            if since:
+                params["since"] = since
+            while url and (limit is None or exported < limit):
+                response = client.get(url, params=params, auth=auth)
+                typer.echo(f"Retrieving: {response.request.url}", err=True)
+                response.raise_for_status()
+                batch = response.json()
+                if limit is not None:
+                    batch = batch[: limit - exported]
+                exported += len(batch)
+                url = response.links.get("next", {}).get("url")
+                params = None  # the next link carries its own query string
+
+                if pool is None:
+                    write(transform(batch) if transform else batch)
+                    continue
+                pending.append(pool.submit(transform, batch))
+                _drain(pending, write, max_pending=2 * workers)
+            _drain(pending, write, max_pending=0)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            typer.echo(
+                "❌ Authentication failed. Please run `feedscope auth login` again.",
+                color=typer.colors.RED,
+            )
+        else:
+            typer.echo(
+                f"❌ Unexpected response: {e.response.status_code}",
+                color=typer.colors.RED,
+            )
+        raise typer.Exit(1)
+    except httpx.RequestError as e:
+        typer.echo(f"❌ Network error: {e}", color=typer.colors.RED)
+        raise typer.Exit(1)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    typer.echo(f"Exported {exported} entries.", err=True)
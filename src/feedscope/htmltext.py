@@ -0,0 +1,122 @@
+"""Turn entry HTML into plain text and outbound links."""
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+import re
+
+# Elements that start a new line of text
+BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+        "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+        "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+        "td", "th", "tr", "ul",
+    }
+)
+# Elements whose text is never shown to a reader
+SKIPPED_TAGS = frozenset({"script", "style", "template", "noscript", "head"})
+
+# Size of the pieces fed to the parser, so huge entries never need a second
+# full-size copy of their markup in flight.
+FEED_CHUNK_SIZE = 64 * 1024
+
+_SPACES = re.compile(r"\s+")
+_WORDS = re.compile(r"\w+(?:['’-]\w+)*")
+
+
+@dataclass
+class ExtractedContent:
+    """Plain text and outbound links found in one piece of HTML."""
+
+    text: str
+    links: list[str] = field(default_factory=list)
+
+    @property
+    def word_count(self) -> int:
+        return len(_WORDS.findall(self.text))
+
+
+class TextExtractor(HTMLParser):
+    """Incremental HTML parser collecting text and ``<a href>`` links.
+
+    Feed markup in any number of pieces with :meth:`feed`, then call
+    :meth:`result`. Links are kept when they are absolute ``http(s)`` URLs
+    on a different host from ``base_url``.
+    """
+
+    def __init__(self, base_url: str | None = None) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_host = urlsplit(base_url).hostname if base_url else None
+        self._lines: list[str] = []
+        self._current: list[str] = []
+        self._skipping = 0
+        self._links: dict[str, None] = {}
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag in BLOCK_TAGS:
+            self._break()
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self._add_link(href.strip())
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag in BLOCK_TAGS:
+            self._break()
+
+    def handle_data(self, data: str) -> None:
+        if not self._skipping:
+            self._current.append(data)
+
+    def _break(self) -> None:
+        line = _SPACES.sub(" ", "".join(self._current)).strip()
+        if line:
+            self._lines.append(line)
+        self._current.clear()
+
+    def _add_link(self, href: str) -> None:
+        parts = urlsplit(href)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return
+        if self.base_host and parts.hostname == self.base_host:
+            return
+        self._links[href] = None
+
+    def result(self) -> ExtractedContent:
+        self.close()
+        self._break()
+        return ExtractedContent(text="\n".join(self._lines), links=list(self._links))
+
+
+def extract(html: str | None, base_url: str | None = None) -> ExtractedContent:
+    """Extract text and outbound links from an HTML string."""
+
+    parser = TextExtractor(base_url)
+    html = html or ""
+    for start in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[start : start + FEED_CHUNK_SIZE])
+    return parser.result()
+
+
+def transform_entries(
+    entries: list[dict], *, text: bool = False, links: bool = False, word_count: bool = False
+) -> list[dict]:
+    """Add ``text``, ``links`` and/or ``word_count`` fields derived from each entry's content.
+
+    Module-level so a batch can be sent to a worker process.
+    """
+
+    for entry in entries:
+        extracted = extract(entry.get("content"), entry.get("url"))
+        if text:
+            entry["text"] = extracted.text
+        if links:
+            entry["links"] = extracted.links
+        if word_count:
+            entry["word_count"] = extracted.word_count
+    return entries
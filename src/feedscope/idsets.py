@@ -0,0 +1,36 @@
+"""Compact on-disk encoding and fast diffing of entry ID sets."""
+
+from array import array
+from collections.abc import Iterable
+from itertools import accumulate
+import zlib
+
+# Sorted IDs are stored as gaps between neighbours. Gaps are small and
+# repetitive, so the fixed-width array compresses to a few bits per ID.
+_TYPECODE = "Q"
+
+
+def encode_ids(ids: Iterable[int]) -> bytes:
+    """Encode non-negative integer IDs as compressed sorted gaps."""
+
+    ordered = sorted(set(ids))
+    gaps = array(_TYPECODE, (b - a for a, b in zip([0, *ordered], ordered)))
+    return zlib.compress(gaps.tobytes(), 6)
+
+
+def decode_ids(payload: bytes) -> array:
+    """Decode :func:`encode_ids` output into a sorted ``array`` of IDs."""
+
+    gaps = array(_TYPECODE)
+    gaps.frombytes(zlib.decompress(payload))
+    return array(_TYPECODE, accumulate(gaps))
+
+
+def diff_ids(
+    previous: Iterable[int], current: Iterable[int]
+) -> tuple[list[int], list[int]]:
+    """Return ``(added, removed)`` between two ID collections, each sorted."""
+
+    before = set(previous)
+    after = set(current)
+    return sorted(after - before), sorted(before - after)
@@ -0,0 +1,189 @@
+"""Per-request HTTP metrics collected through httpx event hooks."""
+
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import json
+import os
+import re
+import statistics
+import time
+
+import httpx
+from loguru import logger
+
+_ID_SEGMENT_RE = re.compile(r"/\d+(?=[/.]|$)")
+
+_STARTED_KEY = "feedscope_started"
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse numeric path segments, e.g. ``/v2/subscriptions/{id}.json``."""
+
+    return _ID_SEGMENT_RE.sub("/{id}", path)
+
+
+def cache_status(response: httpx.Response) -> str:
+    """Classify a response as a hishel cache ``hit``, ``miss`` or ``revalidated``."""
+
+    if "from_cache" not in response.extensions:
+        return "uncached"
+    if response.extensions.get("revalidated"):
+        return "revalidated"
+    return "hit" if response.extensions["from_cache"] else "miss"
+
+
+@dataclass
+class RequestSample:
+    """Measurements for a single HTTP exchange."""
+
+    method: str
+    endpoint: str
+    status: int
+    duration: float
+    bytes: int
+    cache: str
+
+
+@dataclass
+class RequestMetrics:
+    """Collect request samples and summarize them per endpoint.
+
+    Every request is logged; samples are only retained while ``enabled`` so
+    long-running processes do not accumulate them unless asked to.
+    """
+
+    samples: list[RequestSample] = field(default_factory=list)
+    enabled: bool = True
+
+    def reset(self) -> None:
+        self.samples.clear()
+
+    def on_request(self, request: httpx.Request) -> None:
+        request.extensions[_STARTED_KEY] = time.perf_counter()
+
+    def on_response(self, response: httpx.Response) -> None:
+        # Reading here makes the duration and byte count cover the body too.
+        response.read()
+        request = response.request
+        started = request.extensions.get(_STARTED_KEY, time.perf_counter())
+        sample = RequestSample(
+            method=request.method,
+            endpoint=endpoint_template(request.url.path),
+            status=response.status_code,
+            duration=time.perf_counter() - started,
+            bytes=len(request.content) + len(response.content),
+            cache=cache_status(response),
+        )
+        if self.enabled:
+            self.samples.append(sample)
+        logger.bind(request_metrics=asdict(sample)).debug(
+            "{} {} -> {} in {:.1f}ms ({} bytes, cache {})",
+            sample.method,
+            sample.endpoint,
+            sample.status,
+            sample.duration * 1000,
+            sample.bytes,
+            sample.cache,
+        )
+
+    def summary(self) -> list[dict]:
+        """Aggregate samples by method and endpoint template."""
+
+        groups: dict[tuple[str, str], list[RequestSample]] = {}
+        for sample in self.samples:
+            groups.setdefault((sample.method, sample.endpoint), []).append(sample)
+
+        summary = []
+        for (method, endpoint), samples in sorted(groups.items()):
+            durations = sorted(sample.duration for sample in samples)
+            summary.append(
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": len(samples),
+                    "statuses": dict(Counter(str(sample.status) for sample in samples)),
+                    "cache": dict(Counter(sample.cache for sample in samples)),
+                    "bytes": sum(sample.bytes for sample in samples),
+                    "duration_seconds": {
+                        "sum": sum(durations),
+                        "min": durations[0],
+                        "max": durations[-1],
+                        "p50": statistics.median(durations),
+                        "p99": durations[min(len(durations) - 1, round(0.99 * (len(durations) - 1)))],
+                    },
+                }
+            )
+        return summary
+
+    def to_prometheus(self) -> str:
+        """Render the summary in the Prometheus text exposition format."""
+
+        lines = [
+            "# HELP feedscope_requests_total HTTP requests made to the Feedbin API.",
+            "# TYPE feedscope_requests_total counter",
+        ]
+        summary = self.summary()
+        for group in summary:
+            labels = f'method="{group["method"]}",endpoint="{group["endpoint"]}"'
+            for status, count in group["statuses"].items():
+                lines.append(f'feedscope_requests_total{{{labels},status="{status}"}} {count}')
+
+        lines += [
+            "# HELP feedscope_cache_responses_total Responses by HTTP cache outcome.",
+            "# TYPE feedscope_cache_responses_total counter",
+        ]
+        for group in summary:
+            labels = f'method="{group["method"]}",endpoint="{group["endpoint"]}"'
+            for cache, count in group["cache"].items():
+                lines.append(f'feedscope_cache_responses_total{{{labels},cache="{cache}"}} {count}')
+
+        lines += [
+            "# HELP feedscope_request_duration_seconds Request duration including the body.",
+            "# TYPE feedscope_request_duration_seconds summary",
+        ]
+        for group in summary:
+            labels = f'method="{group["method"]}",endpoint="{group["endpoint"]}"'
+            durations = group["duration_seconds"]
+            lines.append(f'feedscope_request_duration_seconds{{{labels},quantile="0.5"}} {durations["p50"]}')
+            lines.append(f'feedscope_request_duration_seconds{{{labels},quantile="0.99"}} {durations["p99"]}')
+            lines.append(f"feedscope_request_duration_seconds_sum{{{labels}}} {durations['sum']}")
+            lines.append(f"feedscope_request_duration_seconds_count{{{labels}}} {group['count']}")
+
+        lines += [
+            "# HELP feedscope_transfer_bytes_total Request and response body bytes.",
+            "# TYPE feedscope_transfer_bytes_total counter",
+        ]
+        for group in summary:
+            labels = f'method="{group["method"]}",endpoint="{group["endpoint"]}"'
+            lines.append(f"feedscope_transfer_bytes_total{{{labels}}} {group['bytes']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Write the summary as Prometheus text (``.prom``) or JSON.
+
+        The file is replaced atomically so textfile collectors never read a
+        partial write.
+        """
+
+        if path.suffix == ".prom":
+            payload = self.to_prometheus()
+        else:
+            payload = json.dumps(
+                {"requests": len(self.samples), "endpoints": self.summary()}, indent=2
+            )
+
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, path)
+        logger.debug("Wrote request metrics for {} requests to {}", len(self.samples), path)
+
+
+_REQUEST_METRICS = RequestMetrics(enabled=False)
+
+
+def get_request_metrics() -> RequestMetrics:
+    """Return the process-wide request metrics collector."""
+
+    return _REQUEST_METRICS
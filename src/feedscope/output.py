@@ -0,0 +1,147 @@
+"""Buffered, optionally compressed output for listing and export commands."""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO
+import gzip
+import os
+import sys
+
+import typer
+from loguru import logger
+from typing_extensions import Annotated
+
+# Large chunks amortize the per-write cost of encoding, compression and syscalls.
+BUFFER_SIZE = 1 << 20
+
+
+class Compression(str, Enum):
+    auto = "auto"
+    none = "none"
+    gzip = "gzip"
+    zstd = "zstd"
+
+
+OutputOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--output",
+        "-o",
+        help="Write results to this file instead of stdout. The file is replaced atomically on success.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+]
+
+CompressionOption = Annotated[
+    Compression,
+    typer.Option(
+        "--compress",
+        help="Compress --output. 'auto' picks gzip for .gz and zstd for .zst files; stdout is never compressed.",
+        case_sensitive=False,
+    ),
+]
+
+
+def resolve_compression(path: Path, compression: Compression) -> Compression:
+    """Pick the compression for ``path`` when ``auto`` is requested."""
+
+    if compression is not Compression.auto:
+        return compression
+    return {".gz": Compression.gzip, ".zst": Compression.zstd}.get(
+        path.suffix.lower(), Compression.none
+    )
+
+
+def _zstd_writer(raw: BinaryIO) -> BinaryIO:
+    try:
+        import zstandard
+    except ImportError:
+        typer.echo(
+            "❌ zstd compression requires the `zstandard` package. Install it or use --compress gzip.",
+            color=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(1)
+    return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+
+
+class OutputWriter:
+    """Accumulate lines and hand them to the sink in large chunks."""
+
+    def __init__(self, sink: Callable[[str], None], buffer_size: int = BUFFER_SIZE) -> None:
+        self._sink = sink
+        self._buffer_size = buffer_size
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self.lines = 0
+
+    def write_line(self, line: str) -> None:
+        self._pending.append(line)
+        self._pending.append("\n")
+        self._pending_size += len(line) + 1
+        self.lines += 1
+        if self._pending_size >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._sink("".join(self._pending))
+            self._pending.clear()
+            self._pending_size = 0
+
+
+@contextmanager
+def open_output(
+    path: Path | None = None, compression: Compression = Compression.auto
+) -> Iterator[OutputWriter]:
+    """Yield a writer for stdout, or for ``path`` written via a temporary file.
+
+    File output only appears at ``path`` once the block completes; if it raises
+    (including ``typer.Exit``), the partial file is removed. Explicit
+    compression without ``path`` is rejected rather than silently ignored.
+    """
+
+    if path is None:
+        if compression not in (Compression.auto, Compression.none):
+            typer.echo(
+                f"❌ --compress {compression.value} requires --output.",
+                color=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(1)
+        writer = OutputWriter(sys.stdout.write)
+        try:
+            yield writer
+        finally:
+            writer.flush()
+            sys.stdout.flush()
+        return
+
+    compression = resolve_compression(path, compression)
+    tmp_path = path.with_name(f".{path.name}.part")
+    raw = open(tmp_path, "wb", buffering=BUFFER_SIZE)
+    try:
+        if compression is Compression.gzip:
+            stream: BinaryIO = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+        elif compression is Compression.zstd:
+            stream = _zstd_writer(raw)
+        else:
+            stream = raw
+
+        writer = OutputWriter(lambda text: stream.write(text.encode("utf-8")))
+        yield writer
+        writer.flush()
+        if stream is not raw:
+            stream.close()
+        raw.close()
+        os.replace(tmp_path, path)
+        logger.debug(
+            "Wrote {} lines to {} ({} compression)", writer.lines, path, compression.value
+        )
+    except BaseException:
+        raw.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,209 @@
+"""Optional profiling of a single CLI invocation."""
+
+from collections import Counter
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+import cProfile
+import io
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+
+import typer
+from loguru import logger
+
+TOP_N = 10
+
+# Map module path components (or builtin owner names) to the coarse buckets
+# people ask about when a run is slow.
+_CATEGORIES: tuple[tuple[str, frozenset[str]], ...] = (
+    (
+        "network",
+        frozenset(
+            {"httpx", "httpcore", "hishel", "h11", "anyio", "ssl", "_ssl", "socket", "_socket", "select", "selectors"}
+        ),
+    ),
+    ("json", frozenset({"json", "_json"})),
+    ("output", frozenset({"click", "typer", "rich"})),
+    (
+        "config",
+        frozenset({"pydantic", "pydantic_core", "pydantic_settings", "tomlkit", "tomllib", "platformdirs", "loguru_config"}),
+    ),
+    ("store", frozenset({"sqlite3", "_sqlite3", "zlib"})),
+)
+
+_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+class ProfileMode(str, Enum):
+    cprofile = "cprofile"
+    tracemalloc = "tracemalloc"
+    wall = "wall"
+
+
+def categorize(filename: str, function: str = "") -> str:
+    """Return the coarse category (network, json, output, ...) of a code location."""
+
+    if filename == "~":
+        # cProfile reports builtins as "~" with the owner in the function name
+        names = set(_WORD_RE.findall(function))
+    else:
+        names = set(Path(filename).with_suffix("").parts)
+    for category, modules in _CATEGORIES:
+        if names & modules:
+            return category
+    return "other"
+
+
+def _format_breakdown(totals: Counter, total: float, unit: str) -> str:
+    parts = []
+    for category, value in totals.most_common():
+        amount = f"{value:.3f}" if isinstance(value, float) else str(value)
+        share = f" ({value / total:.0%})" if total else ""
+        parts.append(f"{category} {amount}{unit}{share}")
+    return ", ".join(parts)
+
+
+class CProfileSession:
+    """Deterministic profile written as a ``.pstats`` file."""
+
+    suffix = ".pstats"
+
+    def __init__(self) -> None:
+        self.profiler = cProfile.Profile()
+
+    def start(self) -> None:
+        self.profiler.enable()
+
+    def stop(self, artifact: Path) -> list[str]:
+        self.profiler.disable()
+        self.profiler.dump_stats(artifact)
+
+        stats = pstats.Stats(self.profiler)
+        totals: Counter = Counter()
+        for (filename, _, function), (_, _, tottime, _, _) in stats.stats.items():
+            totals[categorize(filename, function)] += tottime
+
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats("cumulative").print_stats(TOP_N)
+        top = [line for line in stream.getvalue().splitlines() if line.strip()]
+        return [
+            f"total {stats.total_tt:.3f}s: {_format_breakdown(totals, stats.total_tt, 's')}",
+            *top[-(TOP_N + 1) :],
+        ]
+
+
+class TracemallocSession:
+    """Allocation tracking written as a top-N text report."""
+
+    suffix = ".allocations.txt"
+
+    def start(self) -> None:
+        tracemalloc.start(25)
+
+    def stop(self, artifact: Path) -> list[str]:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+        top = snapshot.statistics("lineno")[:TOP_N]
+        totals: Counter = Counter()
+        for stat in snapshot.statistics("filename"):
+            totals[categorize(stat.traceback[0].filename)] += stat.size / 1024
+
+        lines = [
+            f"current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB",
+            f"by category: {_format_breakdown(totals, sum(totals.values()), ' KiB')}",
+            *(str(stat) for stat in top),
+        ]
+        artifact.write_text("\n".join(lines) + "\n")
+        return lines[: 2 + min(5, len(top))]
+
+
+class WallSession:
+    """Sampling wall-clock profiler written as collapsed stacks for flamegraphs."""
+
+    suffix = ".collapsed"
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.categories: Counter = Counter()
+        self._stop = threading.Event()
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._sample, name="feedscope-profiler", daemon=True)
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+
+            labels = []
+            category = "other"
+            while frame is not None:
+                code = frame.f_code
+                labels.append(f"{code.co_qualname} ({Path(code.co_filename).name})")
+                if category == "other":
+                    category = categorize(code.co_filename)
+                frame = frame.f_back
+            self.stacks[";".join(reversed(labels))] += 1
+            self.categories[category] += 1
+
+    def stop(self, artifact: Path) -> list[str]:
+        self._stop.set()
+        self._thread.join()
+        elapsed = time.perf_counter() - self.started
+
+        artifact.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+        )
+        samples = sum(self.categories.values())
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return [
+            f"wall {elapsed:.3f}s, {samples} samples: "
+            f"{_format_breakdown(self.categories, samples, ' samples')}",
+            *(f"{count:>6}  {leaf}" for leaf, count in leaves.most_common(5)),
+        ]
+
+
+_SESSIONS = {
+    ProfileMode.cprofile: CProfileSession,
+    ProfileMode.tracemalloc: TracemallocSession,
+    ProfileMode.wall: WallSession,
+}
+
+
+def start_profile(ctx: typer.Context, mode: ProfileMode, output_dir: Path) -> None:
+    """Profile the rest of this invocation and report when the context closes."""
+
+    session = _SESSIONS[mode]()
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    artifact = output_dir / f"feedscope-{stamp}-{mode.value}{session.suffix}"
+
+    def finish() -> None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        summary = session.stop(artifact)
+        logger.debug("Wrote {} profile to {}", mode.value, artifact)
+        typer.echo(f"⏱️  {mode.value} profile written to {artifact}", err=True)
+        for line in summary:
+            typer.echo(f"   {line}", err=True)
+
+    session.start()
+    ctx.call_on_close(finish)
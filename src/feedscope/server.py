@@ -0,0 +1,442 @@
+"""Serve the locally synced store over a small HTTP/JSON API."""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from hashlib import sha256
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlencode
+import asyncio
+import json
+import threading
+
+import typer
+from loguru import logger
+from typing_extensions import Annotated
+
+from .config import DEFAULT_ACCOUNT, AuthCredentials, get_config
+from .state import get_state
+from .store import FeedscopeStore, account_store_path
+from .sync import sync_account
+
+DEFAULT_PER_PAGE = 100
+MAX_PER_PAGE = 1000
+
+# Rendered responses kept between store changes, bounded by count and size so
+# arbitrary query strings cannot grow the cache without limit.
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+Rendered = tuple[str, bytes, list[tuple[bytes, bytes]]]
+
+
+class HTTPError(Exception):
+    """An error response to send instead of a document."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _int_param(params: dict[str, str], name: str, default: int | None = None, **bounds: int) -> int | None:
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise HTTPError(400, f"{name} must be an integer")
+    if number < bounds.get("minimum", number) or number > bounds.get("maximum", number):
+        raise HTTPError(400, f"{name} must be between {bounds['minimum']} and {bounds['maximum']}")
+    return number
+
+
+class ResponseCache:
+    """Least-recently-used cache of rendered responses."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items: OrderedDict[str, Rendered] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> Rendered | None:
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def put(self, key: str, item: Rendered) -> None:
+        if len(item[1]) > self.max_bytes:
+            return
+        if key in self._items:
+            self.size -= len(self._items.pop(key)[1])
+        self._items[key] = item
+        self.size += len(item[1])
+        while len(self._items) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= len(evicted[1])
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.size = 0
+
+
+class QueryApp:
+    """ASGI application answering read-only queries from a local store.
+
+    Routes mirror the Feedbin API: ``/subscriptions.json`` and
+    ``/entries.json`` (with ``feed_id``, ``q``, ``since``, ``until``,
+    ``page`` and ``per_page``), ``/subscriptions/<id>.json``,
+    ``/entries/<id>.json`` and ``/status.json``. Every document carries an
+    ETag; rendered responses are cached until the store changes.
+
+    Requests are answered in worker threads so SQLite queries never block
+    the event loop; a lock serializes use of the single store connection.
+    """
+
+    def __init__(self, store_path: Path, refresher: "Refresher | None" = None) -> None:
+        self.store_path = store_path
+        self.refresher = refresher
+        self._store: FeedscopeStore | None = None
+        self._version: int | None = None
+        self._cache = ResponseCache()
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> FeedscopeStore:
+        if self._store is None:
+            self._store = FeedscopeStore(self.store_path, check_same_thread=False)
+        return self._store
+
+    def close(self) -> None:
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    self.close()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        status, body, headers = await asyncio.to_thread(
+            self.handle,
+            scope["method"],
+            scope["path"],
+            scope.get("query_string", b"").decode("latin-1"),
+            dict(scope.get("headers", [])),
+        )
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    def handle(
+        self, method: str, path: str, query: str, request_headers: dict[bytes, bytes]
+    ) -> tuple[int, bytes, list[tuple[bytes, bytes]]]:
+        """Answer one request, returning ``(status, body, headers)``.
+
+        Blocking; call it from a worker thread when serving asynchronously.
+        """
+
+        if method not in ("GET", "HEAD"):
+            return self._error(405, "Only GET requests are supported")
+
+        with self._lock:
+            version = self.store.data_version()
+            if version != self._version:
+                self._cache.clear()
+                self._version = version
+
+            key = f"{path}?{query}"
+            cached = None if path == "/status.json" else self._cache.get(key)
+            if cached is None:
+                try:
+                    body, extra = self._render(path, dict(parse_qsl(query)))
+                except HTTPError as e:
+                    return self._error(e.status, e.message)
+                etag = f'"{sha256(body).hexdigest()[:32]}"'
+                cached = (etag, body, extra)
+                if path != "/status.json":
+                    self._cache.put(key, cached)
+
+        etag, body, extra = cached
+        headers = [
+            (b"content-type", b"application/json; charset=utf-8"),
+            (b"etag", etag.encode()),
+            (b"cache-control", b"no-cache"),
+            *extra,
+        ]
+        if_none_match = request_headers.get(b"if-none-match", b"").decode("latin-1")
+        if etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}:
+            return 304, b"", headers
+        headers.append((b"content-length", str(len(body)).encode()))
+        return 200, b"" if method == "HEAD" else body, headers
+
+    def _render(self, path: str, params: dict[str, str]) -> tuple[bytes, list[tuple[bytes, bytes]]]:
+        if path == "/status.json":
+            return json.dumps(self._status()).encode(), []
+
+        name, _, rest = path.strip("/").partition("/")
+        if name in ("subscriptions", "entries") and rest.endswith(".json"):
+            try:
+                item_id = int(rest.removesuffix(".json"))
+            except ValueError:
+                raise HTTPError(404, f"No route for {path}")
+            document = self.store.get_document(name, item_id)
+            if document is None:
+                raise HTTPError(404, f"No {name} with id {item_id}")
+            return document.encode(), []
+
+        if path not in ("/subscriptions.json", "/entries.json"):
+            raise HTTPError(404, f"No route for {path}")
+
+        page = _int_param(params, "page", 1, minimum=1, maximum=1_000_000)
+        per_page = _int_param(params, "per_page", DEFAULT_PER_PAGE, minimum=1, maximum=MAX_PER_PAGE)
+        filters = {
+            "feed_id": _int_param(params, "feed_id"),
+            "search": params.get("q"),
+            "limit": per_page,
+            "offset": (page - 1) * per_page,
+        }
+        if path == "/entries.json":
+            documents, total = self.store.query_entries(
+                since=params.get("since"), until=params.get("until"), **filters
+            )
+        else:
+            documents, total = self.store.query_subscriptions(**filters)
+
+        body = ("[" + ",".join(documents) + "]").encode()
+        links = []
+        if page * per_page < total:
+            links.append(f'<{path}?{urlencode({**params, "page": page + 1})}>; rel="next"')
+        if page > 1:
+            links.append(f'<{path}?{urlencode({**params, "page": page - 1})}>; rel="prev"')
+        extra = [(b"x-total-count", str(total).encode())]
+        if links:
+            extra.append((b"link", ", ".join(links).encode()))
+        return body, extra
+
+    def _status(self) -> dict:
+        status = {
+            "store": str(self.store_path),
+            "entries_synced_at": self.store.get_sync_state("entries_synced_at"),
+            "updated_synced_at": self.store.get_sync_state("updated_synced_at"),
+        }
+        if self.refresher is not None:
+            status.update(self.refresher.status())
+        return status
+
+    def _error(self, status: int, message: str) -> tuple[int, bytes, list[tuple[bytes, bytes]]]:
+        body = json.dumps({"error": message}).encode()
+        return (
+            status,
+            body,
+            [
+                (b"content-type", b"application/json; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        )
+
+
+class Refresher(threading.Thread):
+    """Periodically sync one account into the served store in the background."""
+
+    def __init__(
+        self,
+        account: str,
+        credentials: AuthCredentials,
+        store_path: Path,
+        *,
+        interval: float,
+        requests_per_second: float | None = None,
+    ) -> None:
+        super().__init__(name="feedscope-refresh", daemon=True)
+        self.account = account
+        self.credentials = credentials
+        self.store_path = store_path
+        self.interval = interval
+        self.requests_per_second = requests_per_second
+        self.last_refresh: str | None = None
+        self.last_error: str | None = None
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            result = sync_account(
+                self.account,
+                self.credentials,
+                self.store_path,
+                requests_per_second=self.requests_per_second,
+            )
+            self.last_refresh = datetime.now(timezone.utc).isoformat()
+            self.last_error = result.error
+            if result.error:
+                logger.warning("Background refresh of {} failed: {}", self.account, result.error)
+            else:
+                logger.info(
+                    "Refreshed {}: {} subscriptions, {} entries",
+                    self.account,
+                    result.subscriptions,
+                    result.entries,
+                )
+            self._stopped.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def status(self) -> dict:
+        return {
+            "refresh_interval": self.interval,
+            "last_refresh": self.last_refresh,
+            "last_refresh_error": self.last_error,
+        }
+
+
+_REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+async def _handle_connection(app: QueryApp, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal keep-alive HTTP/1.1 front end for GET requests without bodies.
+
+    Request bodies are never read, so a request announcing one gets its
+    response and then the connection is closed rather than parsing the body
+    as the next request.
+    """
+
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            try:
+                method, target, version = request_line.split(" ", 2)
+            except ValueError:
+                return
+            headers = {}
+            for line in header_lines:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower().encode()] = value.strip().encode("latin-1")
+            path, _, query = target.partition("?")
+            path = unquote(path)
+            has_body = b"transfer-encoding" in headers or headers.get(b"content-length", b"0") != b"0"
+
+            status, body, response_headers = await asyncio.to_thread(
+                app.handle, method, path, query, headers
+            )
+            keep_alive = (
+                version == "HTTP/1.1" and headers.get(b"connection") != b"close" and not has_body
+            )
+            lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}"]
+            lines += [f"{name.decode()}: {value.decode()}" for name, value in response_headers]
+            lines.append(f"connection: {'keep-alive' if keep_alive else 'close'}")
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+            await writer.drain()
+            if not keep_alive:
+                return
+    finally:
+        writer.close()
+
+
+async def _start_server(app: QueryApp, host: str, port: int) -> asyncio.Server:
+    return await asyncio.start_server(
+        lambda reader, writer: _handle_connection(app, reader, writer), host, port
+    )
+
+
+async def _serve_forever(app: QueryApp, host: str, port: int) -> None:
+    server = await _start_server(app, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def run_app(app: QueryApp, host: str, port: int) -> None:
+    """Run the app under uvicorn when installed, else the built-in server."""
+
+    try:
+        import uvicorn
+    except ImportError:
+        logger.debug("uvicorn not installed; using the built-in HTTP server")
+        try:
+            asyncio.run(_serve_forever(app, host, port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            app.close()
+        return
+
+    uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+def serve(
+    ctx: typer.Context,
+    host: Annotated[str, typer.Option("--host", help="Interface to listen on.")] = "127.0.0.1",
+    port: Annotated[int, typer.Option("--port", "-p", help="Port to listen on.", min=0)] = 8787,
+    account: Annotated[
+        str,
+        typer.Option("--account", "-a", help="Account whose store is served."),
+    ] = DEFAULT_ACCOUNT,
+    refresh: Annotated[
+        float,
+        typer.Option(
+            "--refresh",
+            help="Seconds between background syncs (0 to serve the store as is).",
+            min=0,
+        ),
+    ] = 300.0,
+    rate: Annotated[
+        float,
+        typer.Option(
+            "--rate",
+            help="Maximum requests per second for background syncs (0 for unlimited).",
+            min=0,
+        ),
+    ] = 10.0,
+) -> None:
+    """Serve synced subscriptions and entries from the local store over HTTP."""
+    state = get_state(ctx)
+    logger.debug("Serving the local store with log config {}", state.log_config_path)
+    try:
+        store_path = account_store_path(account)
+    except ValueError as e:
+        typer.echo(f"❌ {e}", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    refresher = None
+    if refresh:
+        configured = get_config().all_accounts()
+        if account not in configured:
+            typer.echo(
+                f"❌ No credentials for account: {account}. "
+                "Use `--refresh 0` to serve the store without syncing.",
+                color=typer.colors.RED,
+            )
+            raise typer.Exit(1)
+        refresher = Refresher(
+            account,
+            configured[account],
+            store_path,
+            interval=refresh,
+            requests_per_second=rate or None,
+        )
+        refresher.start()
+
+    typer.echo(f"Serving {store_path} on http://{host}:{port}", err=True)
+    try:
+        run_app(QueryApp(store_path, refresher), host, port)
+    finally:
+        if refresher is not None:
+            refresher.stop()
@@ -0,0 +1,174 @@
+import json
+from datetime import datetime, timezone
+from enum import Enum
+
+import typer
+import httpx
+from typing_extensions import Annotated
+from loguru import logger
+
+from .config import get_config
+from .client import get_client
+from .idsets import diff_ids
+from .output import Compression, CompressionOption, OutputOption, open_output
+from .state import get_state
+from .store import get_store
+
+snapshots_app = typer.Typer(
+    help="Snapshot unread, starred and recently read entry IDs",
+    invoke_without_command=True,
+)
+
+
+class SnapshotKind(str, Enum):
+    unread = "unread"
+    starred = "starred"
+    recently_read = "recently-read"
+
+
+ENDPOINTS = {
+    SnapshotKind.unread: "https://api.feedbin.com/v2/unread_entries.json",
+    SnapshotKind.starred: "https://api.feedbin.com/v2/starred_entries.json",
+    SnapshotKind.recently_read: "https://api.feedbin.com/v2/recently_read_entries.json",
+}
+
+
+@snapshots_app.callback()
+def snapshots(ctx: typer.Context):
+    """
+    Snapshot unread, starred and recently read entry IDs.
+    """
+    get_state(ctx)
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+
+def _fetch_ids(
+    client: httpx.Client, auth: tuple[str, str], kind: SnapshotKind
+) -> list[int]:
+    response = client.get(ENDPOINTS[kind], auth=auth)
+    typer.echo(f"Retrieving: {response.request.url}", err=True)
+    response.raise_for_status()
+    return response.json()
+
+
+@snapshots_app.command(name="take", help="Snapshot ID sets and emit what changed.")
+def take_snapshots(
+    ctx: typer.Context,
+    kinds: Annotated[
+        list[SnapshotKind],
+        typer.Argument(help="ID sets to snapshot. Defaults to all of them."),
+    ] = None,
+    keep: Annotated[
+        int,
+        typer.Option(
+            "--keep",
+            help="Number of snapshots to retain per ID set.",
+            min=1,
+        ),
+    ] = 30,
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
+) -> None:
+    """Fetches each ID set, diffs it against the last snapshot and writes JSONL deltas."""
+    state = get_state(ctx)
+    logger.debug("Taking ID snapshots with log config {}", state.log_config_path)
+    config = get_config()
+
+    if not config.auth.email or not config.auth.password:
+        typer.echo(
+            "❌ Authentication credentials not found. Please run `feedscope auth login` first.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    auth = (config.auth.email, config.auth.password)
+    deltas = []
+
+    try:
+        with get_client() as client, get_store() as store:
+            for kind in kinds or list(SnapshotKind):
+                current = sorted(set(_fetch_ids(client, auth, kind)))
+                previous = store.latest_id_snapshot(kind.value)
+                added, removed = diff_ids(previous[1] if previous else [], current)
+                # Only a changed set is worth another row; the previous
+                # snapshot still describes an unchanged one.
+                if previous is None or added or removed:
+                    taken_at = store.save_id_snapshot(kind.value, current, keep=keep)
+                else:
+                    taken_at = datetime.now(timezone.utc).isoformat()
+                deltas.append(
+                    {
+                        "kind": kind.value,
+                        "taken_at": taken_at,
+                        "previous": previous[0] if previous else None,
+                        "count": len(current),
+                        "added": added,
+                        "removed": removed,
+                    }
+                )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            typer.echo(
+                "❌ Authentication failed. Please run `feedscope auth login` again.",
+                color=typer.colors.RED,
+            )
+        else:
+            typer.echo(
+                f"❌ Unexpected response: {e.response.status_code}",
+                color=typer.colors.RED,
+            )
+        raise typer.Exit(1)
+    except httpx.RequestError as e:
+        typer.echo(f"❌ Network error: {e}", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    with open_output(output, compress) as writer:
+        for delta in deltas:
+            writer.write_line(json.dumps(delta))
+
+
+@snapshots_app.command(name="list", help="List stored snapshots.")
+def list_snapshots(
+    ctx: typer.Context,
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
+) -> None:
+    """Lists the ID set snapshots held in the local store."""
+    state = get_state(ctx)
+    logger.debug("Listing ID snapshots with log config {}", state.log_config_path)
+
+    with get_store() as store:
+        rows = store.id_snapshots()
+
+    with open_output(output, compress) as writer:
+        for kind, taken_at, id_count, stored_bytes in rows:
+            writer.write_line(
+                f"{kind} {taken_at} {id_count} ids / {stored_bytes}B stored"
+            )
+
+
+@snapshots_app.command(
+    name="ids", help="Print the IDs in the latest snapshot of a set."
+)
+def snapshot_ids(
+    ctx: typer.Context,
+    kind: Annotated[SnapshotKind, typer.Argument(help="The ID set to print.")],
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
+) -> None:
+    """Prints the entry IDs of the most recent snapshot from the local store."""
+    state = get_state(ctx)
+    logger.debug("Printing snapshot IDs with log config {}", state.log_config_path)
+
+    with get_store() as store:
+        snapshot = store.latest_id_snapshot(kind.value)
+
+    if snapshot is None:
+        typer.echo(f"❌ No {kind.value} snapshot stored.", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    with open_output(output, compress) as writer:
+        for entry_id in snapshot[1]:
+            writer.write_line(str(entry_id))
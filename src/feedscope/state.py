@@ -13,6 +13,7 @@ class AppState:
 
     log_config_path: Path | None = None
     log_config_data: dict[str, Any] | None = None
+    metrics_out: Path | None = None
 
 
 def get_state(ctx: typer.Context) -> AppState:
@@ -0,0 +1,445 @@
+"""Local SQLite store for data synced from Feedbin."""
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from hashlib import sha256
+from pathlib import Path
+import json
+import sqlite3
+
+from loguru import logger
+from platformdirs import user_data_dir
+
+from .config import DEFAULT_ACCOUNT, is_valid_account_name
+from .deltas import (
+    apply_delta,
+    compute_delta,
+    decode_delta,
+    decode_text,
+    encode_delta,
+    encode_text,
+)
+from .idsets import decode_ids, encode_ids
+
+# Store a full snapshot every N revisions so rebuilding a late revision never
+# has to replay an unbounded chain of deltas.
+KEYFRAME_INTERVAL = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entry_revisions (
+    entry_id INTEGER NOT NULL,
+    revision INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    content_hash TEXT NOT NULL,
+    content_length INTEGER NOT NULL,
+    title TEXT,
+    url TEXT,
+    recorded_at TEXT NOT NULL,
+    PRIMARY KEY (entry_id, revision)
+);
+
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id INTEGER PRIMARY KEY,
+    feed_id INTEGER,
+    title TEXT,
+    feed_url TEXT,
+    site_url TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    feed_id INTEGER,
+    title TEXT,
+    url TEXT,
+    author TEXT,
+    published TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS entries_feed_id ON entries (feed_id);
+CREATE INDEX IF NOT EXISTS entries_published ON entries (published);
+
+CREATE TABLE IF NOT EXISTS id_snapshots (
+    kind TEXT NOT NULL,
+    taken_at TEXT NOT NULL,
+    id_count INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (kind, taken_at)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def default_store_path() -> Path:
+    """Return the default location of the local store."""
+
+    return Path(user_data_dir("dev.pirateninja.feedscope")) / "feedscope.sqlite3"
+
+
+def account_store_path(account: str) -> Path:
+    """Return the store location for a named account.
+
+    The default account keeps using :func:`default_store_path`. Raises
+    ``ValueError`` for names that are not a single safe path component.
+    """
+
+    if not is_valid_account_name(account):
+        raise ValueError(f"Invalid account name {account!r}")
+    if account == DEFAULT_ACCOUNT:
+        return default_store_path()
+    return (
+        Path(user_data_dir("dev.pirateninja.feedscope"))
+        / "accounts"
+        / f"{account}.sqlite3"
+    )
+
+
+def _filters(*, feed_id: int | None, search: str | None) -> tuple[list[str], list]:
+    where: list[str] = []
+    params: list = []
+    if feed_id is not None:
+        where.append("feed_id = ?")
+        params.append(feed_id)
+    if search:
+        where.append("title LIKE ?")
+        params.append(f"%{search}%")
+    return where, params
+
+
+@dataclass
+class RevisionInfo:
+    """Metadata describing one stored revision of an entry."""
+
+    entry_id: int
+    revision: int
+    kind: str
+    stored_bytes: int
+    content_length: int
+    title: str | None
+    url: str | None
+    recorded_at: str
+
+
+class FeedscopeStore:
+    """Persist synced Feedbin data in a local SQLite database."""
+
+    def __init__(
+        self, path: Path | None = None, *, check_same_thread: bool = True
+    ) -> None:
+        self.path = path or default_store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(
+            self.path, check_same_thread=check_same_thread
+        )
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "FeedscopeStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def get_sync_state(self, key: str) -> str | None:
+        row = self.connection.execute(
+            "SELECT value FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_sync_state(self, key: str, value: str) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value)
+        )
+        self.connection.commit()
+
+    def replace_subscriptions(self, subscriptions: list[dict]) -> None:
+        """Replace the stored subscriptions with a complete list from the API."""
+
+        with self.connection:
+            self.connection.execute("DELETE FROM subscriptions")
+            self.connection.executemany(
+                "INSERT INTO subscriptions (id, feed_id, title, feed_url, site_url, created_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        sub["id"],
+                        sub.get("feed_id"),
+                        sub.get("title"),
+                        sub.get("feed_url"),
+                        sub.get("site_url"),
+                        sub.get("created_at"),
+                        json.dumps(sub),
+                    )
+                    for sub in subscriptions
+                ],
+            )
+
+    def upsert_entries(self, entries: list[dict]) -> None:
+        """Insert or refresh entries returned by the API."""
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO entries (id, feed_id, title, url, author, published, created_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        entry["id"],
+                        entry.get("feed_id"),
+                        entry.get("title"),
+                        entry.get("url"),
+                        entry.get("author"),
+                        entry.get("published"),
+                        entry.get("created_at"),
+                        json.dumps(entry),
+                    )
+                    for entry in entries
+                ],
+            )
+
+    def query_subscriptions(
+        self,
+        *,
+        feed_id: int | None = None,
+        search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[str], int]:
+        """Return one page of stored subscription JSON documents and the total match count."""
+
+        where, params = _filters(feed_id=feed_id, search=search)
+        return self._page("subscriptions", where, params, "id", limit, offset)
+
+    def query_entries(
+        self,
+        *,
+        feed_id: int | None = None,
+        search: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[str], int]:
+        """Return one page of stored entry JSON documents, newest first, and the total match count."""
+
+        where, params = _filters(feed_id=feed_id, search=search)
+        if since:
+            where.append("published >= ?")
+            params.append(since)
+        if until:
+            where.append("published < ?")
+            params.append(until)
+        return self._page(
+            "entries", where, params, "published DESC, id DESC", limit, offset
+        )
+
+    def _page(
+        self,
+        table: str,
+        where: list[str],
+        params: list,
+        order: str,
+        limit: int,
+        offset: int,
+    ) -> tuple[list[str], int]:
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        (total,) = self.connection.execute(
+            f"SELECT COUNT(*) FROM {table}{clause}", params
+        ).fetchone()
+        rows = self.connection.execute(
+            f"SELECT data FROM {table}{clause} ORDER BY {order} LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+        return [row[0] for row in rows], total
+
+    def get_document(self, table: str, item_id: int) -> str | None:
+        """Return the stored JSON document for one subscription or entry."""
+
+        if table not in ("subscriptions", "entries"):
+            raise ValueError(f"Unknown table {table!r}")
+        row = self.connection.execute(
+            f"SELECT data FROM {table} WHERE id = ?", (item_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def data_version(self) -> int:
+        """Return a counter that changes whenever another connection commits."""
+
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def latest_revision(self, entry_id: int) -> int | None:
+        """Return the newest revision number stored for an entry."""
+
+        row = self.connection.execute(
+            "SELECT MAX(revision) FROM entry_revisions WHERE entry_id = ?",
+            (entry_id,),
+        ).fetchone()
+        return row[0]
+
+    def record_entry_revision(
+        self,
+        entry_id: int,
+        content: str | None,
+        *,
+        title: str | None = None,
+        url: str | None = None,
+    ) -> int | None:
+        """Store ``content`` as the next revision of an entry.
+
+        Returns the new revision number, or ``None`` when the content matches
+        the latest stored revision.
+        """
+
+        content = content or ""
+        content_hash = sha256(content.encode("utf-8")).hexdigest()
+        latest = self.latest_revision(entry_id)
+
+        if latest is None:
+            revision = 0
+            kind, payload = "full", encode_text(content)
+        else:
+            (latest_hash,) = self.connection.execute(
+                "SELECT content_hash FROM entry_revisions WHERE entry_id = ? AND revision = ?",
+                (entry_id, latest),
+            ).fetchone()
+            if latest_hash == content_hash:
+                return None
+
+            revision = latest + 1
+            if revision % KEYFRAME_INTERVAL == 0:
+                kind, payload = "full", encode_text(content)
+            else:
+                previous = self.entry_content(entry_id, latest)
+                kind, payload = "delta", encode_delta(compute_delta(previous, content))
+
+        self.connection.execute(
+            "INSERT INTO entry_revisions "
+            "(entry_id, revision, kind, payload, content_hash, content_length, title, url, recorded_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry_id,
+                revision,
+                kind,
+                payload,
+                content_hash,
+                len(content),
+                title,
+                url,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        self.connection.commit()
+        logger.debug(
+            "Stored revision {} of entry {} as {} ({} bytes)",
+            revision,
+            entry_id,
+            kind,
+            len(payload),
+        )
+        return revision
+
+    def entry_revisions(self, entry_id: int) -> list[RevisionInfo]:
+        """List the stored revisions of an entry, oldest first."""
+
+        rows = self.connection.execute(
+            "SELECT entry_id, revision, kind, LENGTH(payload), content_length, title, url, recorded_at "
+            "FROM entry_revisions WHERE entry_id = ? ORDER BY revision",
+            (entry_id,),
+        ).fetchall()
+        return [RevisionInfo(*row) for row in rows]
+
+    def entry_content(self, entry_id: int, revision: int | None = None) -> str:
+        """Rebuild the content of an entry at ``revision`` (latest by default).
+
+        Raises ``KeyError`` if the entry or revision is not stored.
+        """
+
+        if revision is None:
+            revision = self.latest_revision(entry_id)
+            if revision is None:
+                raise KeyError(entry_id)
+
+        keyframe = self.connection.execute(
+            "SELECT MAX(revision) FROM entry_revisions "
+            "WHERE entry_id = ? AND revision <= ? AND kind = 'full'",
+            (entry_id, revision),
+        ).fetchone()[0]
+        if keyframe is None:
+            raise KeyError((entry_id, revision))
+
+        rows = self.connection.execute(
+            "SELECT revision, kind, payload FROM entry_revisions "
+            "WHERE entry_id = ? AND revision BETWEEN ? AND ? ORDER BY revision",
+            (entry_id, keyframe, revision),
+        ).fetchall()
+        if not rows or rows[-1][0] != revision:
+            raise KeyError((entry_id, revision))
+
+        content = ""
+        for _, kind, payload in rows:
+            if kind == "full":
+                content = decode_text(payload)
+            else:
+                content = apply_delta(content, decode_delta(payload))
+        return content
+
+    def latest_id_snapshot(self, kind: str) -> tuple[str, array] | None:
+        """Return ``(taken_at, ids)`` for the newest snapshot of an ID set."""
+
+        row = self.connection.execute(
+            "SELECT taken_at, payload FROM id_snapshots WHERE kind = ? "
+            "ORDER BY taken_at DESC LIMIT 1",
+            (kind,),
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], decode_ids(row[1])
+
+    def save_id_snapshot(
+        self, kind: str, ids: Sequence[int], *, keep: int | None = None
+    ) -> str:
+        """Store an ID set snapshot, keeping only the newest ``keep`` per kind."""
+
+        taken_at = datetime.now(timezone.utc).isoformat()
+        payload = encode_ids(ids)
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO id_snapshots (kind, taken_at, id_count, payload) VALUES (?, ?, ?, ?)",
+                (kind, taken_at, len(ids), payload),
+            )
+            if keep is not None:
+                self.connection.execute(
+                    "DELETE FROM id_snapshots WHERE kind = ? AND taken_at NOT IN "
+                    "(SELECT taken_at FROM id_snapshots WHERE kind = ? ORDER BY taken_at DESC LIMIT ?)",
+                    (kind, kind, keep),
+                )
+        logger.debug(
+            "Stored {} snapshot of {} ids in {} bytes", kind, len(ids), len(payload)
+        )
+        return taken_at
+
+    def id_snapshots(self) -> list[tuple[str, str, int, int]]:
+        """List ``(kind, taken_at, id_count, stored_bytes)`` for every snapshot."""
+
+        return self.connection.execute(
+            "SELECT kind, taken_at, id_count, LENGTH(payload) FROM id_snapshots "
+            "ORDER BY kind, taken_at"
+        ).fetchall()
+
+
+def get_store(path: Path | None = None) -> FeedscopeStore:
+    """Open the local store for use in commands."""
+
+    return FeedscopeStore(path)
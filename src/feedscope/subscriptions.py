@@ -6,6 +6,7 @@ from loguru import logger
 
 from .config import get_config
 from .client import get_client
+from .output import Compression, CompressionOption, OutputOption, open_output
 from .state import get_state
 
 subscriptions_app = typer.Typer(
@@ -51,6 +52,8 @@ def list_subscriptions(
             help="Output the subscriptions in JSONL format.",
         ),
     ] = False,
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
 ) -> None:
     """Retrieves and lists all feed subscriptions from Feedbin."""
     state = get_state(ctx)
@@ -90,23 +93,24 @@ def list_subscriptions(
 
             all_subscriptions = response.json()
 
-        if not all_subscriptions:
-            if not jsonl:
-                typer.echo("No subscriptions found.")
-            return
-
         if limit:
             all_subscriptions = all_subscriptions[:limit]
 
-        if jsonl:
-            for sub in all_subscriptions:
-                typer.echo(json.dumps(sub))
-        elif extended:
-            for sub in all_subscriptions:
-                typer.echo(json.dumps(sub, indent=2))
-        else:
-            for sub in all_subscriptions:
-                typer.echo(f"[{sub['id']}] {sub['title']} - {sub['feed_url']}")
+        # Open the output even when there is nothing to write, so --output
+        # still replaces any earlier file with an empty one.
+        with open_output(output, compress) as writer:
+            if not all_subscriptions:
+                if not jsonl:
+                    typer.echo("No subscriptions found.")
+            elif jsonl:
+                for sub in all_subscriptions:
+                    writer.write_line(json.dumps(sub))
+            elif extended:
+                for sub in all_subscriptions:
+                    writer.write_line(json.dumps(sub, indent=2))
+            else:
+                for sub in all_subscriptions:
+                    writer.write_line(f"[{sub['id']}] {sub['title']} - {sub['feed_url']}")
 
     except httpx.RequestError as e:
         typer.echo(f"❌ Network error: {e}", color=typer.colors.RED)
@@ -127,6 +131,8 @@ def get_subscriptions(
             help="Include extended metadata for the feed.",
         ),
     ] = False,
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
 ) -> None:
     """Retrieves one or more feed subscriptions from Feedbin."""
     state = get_state(ctx)
@@ -141,7 +147,7 @@ def get_subscriptions(
         raise typer.Exit(1)
 
     try:
-        with get_client() as client:
+        with get_client() as client, open_output(output, compress) as writer:
             for subscription_id in subscription_ids:
                 url = f"https://api.feedbin.com/v2/subscriptions/{subscription_id}.json"
                 if extended:
@@ -175,7 +181,7 @@ def get_subscriptions(
                     continue
 
                 subscription = response.json()
-                typer.echo(json.dumps(subscription, indent=2))
+                writer.write_line(json.dumps(subscription, indent=2))
 
     except httpx.RequestError as e:
         typer.echo(f"❌ Network error: {e}", color=typer.colors.RED)
@@ -0,0 +1,302 @@
+"""Synchronize one or more Feedbin accounts into their local stores."""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+import os
+import time
+
+import httpx
+import typer
+from loguru import logger
+from typing_extensions import Annotated
+
+from .client import get_client
+from .config import DEFAULT_ACCOUNT, AuthCredentials, get_config, is_valid_account_name
+from .metrics import RequestSample, get_request_metrics
+from .state import get_state
+from .store import FeedscopeStore, account_store_path
+
+API_BASE = "https://api.feedbin.com/v2"
+
+# GET /v2/entries.json accepts at most 100 ids (and 100 items per page)
+ENTRY_BATCH_SIZE = 100
+
+
+@dataclass
+class AccountSyncResult:
+    """Outcome of syncing a single account, returned from worker processes."""
+
+    account: str
+    subscriptions: int = 0
+    entries: int = 0
+    updated_entries: int = 0
+    new_revisions: int = 0
+    duration: float = 0.0
+    error: str | None = None
+    samples: list[RequestSample] = field(default_factory=list)
+
+
+def _get(
+    client: httpx.Client, url: str, auth: tuple[str, str], params: dict | None = None
+) -> httpx.Response:
+    response = client.get(url, params=params, auth=auth)
+    logger.debug("Retrieved {} ({})", response.request.url, response.status_code)
+    response.raise_for_status()
+    return response
+
+
+def store_updated_revisions(
+    client: httpx.Client,
+    auth: tuple[str, str],
+    store: FeedscopeStore,
+    entry_ids: list[int],
+) -> int:
+    """Hydrate updated entry IDs and record changed content as revisions.
+
+    The original version of an entry not seen before is stored as revision 0.
+    Returns the number of new revisions of the current content.
+    """
+
+    new_revisions = 0
+    for start in range(0, len(entry_ids), ENTRY_BATCH_SIZE):
+        batch = entry_ids[start : start + ENTRY_BATCH_SIZE]
+        response = _get(
+            client,
+            f"{API_BASE}/entries.json",
+            auth,
+            params={
+                "ids": ",".join(str(entry_id) for entry_id in batch),
+                "include_original": "true",
+            },
+        )
+        for entry in response.json():
+            original = entry.get("original")
+            if original and store.latest_revision(entry["id"]) is None:
+                store.record_entry_revision(
+                    entry["id"],
+                    original.get("content"),
+                    title=original.get("title"),
+                    url=original.get("url"),
+                )
+            revision = store.record_entry_revision(
+                entry["id"],
+                entry.get("content"),
+                title=entry.get("title"),
+                url=entry.get("url"),
+            )
+            if revision is not None:
+                new_revisions += 1
+    return new_revisions
+
+
+def sync_account(
+    account: str,
+    credentials: AuthCredentials,
+    store_path: Path,
+    *,
+    requests_per_second: float | None = None,
+    since: str | None = None,
+) -> AccountSyncResult:
+    """Sync subscriptions, new entries and updated entries for one account.
+
+    Entries and updated entries are fetched incrementally from the previous
+    successful sync unless ``since`` overrides it. Errors are reported in the
+    result rather than raised so one failing account does not stop the rest.
+    """
+
+    result = AccountSyncResult(account=account)
+    metrics = get_request_metrics()
+    first_sample = len(metrics.samples)
+    started = time.perf_counter()
+    sync_started = datetime.now(timezone.utc).isoformat()
+    auth = (credentials.email, credentials.password)
+
+    try:
+        with get_client(requests_per_second) as client, FeedscopeStore(store_path) as store:
+            subscriptions = _get(client, f"{API_BASE}/subscriptions.json", auth).json()
+            store.replace_subscriptions(subscriptions)
+            result.subscriptions = len(subscriptions)
+
+            entries_since = since or store.get_sync_state("entries_synced_at")
+            params: dict | None = {"per_page": ENTRY_BATCH_SIZE}
+            if entries_since:
+                params["since"] = entries_since
+            url: str | None = f"{API_BASE}/entries.json"
+            while url:
+                response = _get(client, url, auth, params=params)
+                entries = response.json()
+                store.upsert_entries(entries)
+                result.entries += len(entries)
+                url = response.links.get("next", {}).get("url")
+                params = None  # the next link carries its own query string
+
+            updated_since = since or store.get_sync_state("updated_synced_at")
+            updated_ids = _get(
+                client,
+                f"{API_BASE}/updated_entries.json",
+                auth,
+                params={"since": updated_since} if updated_since else None,
+            ).json()
+            result.updated_entries = len(updated_ids)
+            result.new_revisions = store_updated_revisions(client, auth, store, updated_ids)
+
+            store.set_sync_state("entries_synced_at", sync_started)
+            store.set_sync_state("updated_synced_at", sync_started)
+    except httpx.HTTPStatusError as e:
+        result.error = f"HTTP {e.response.status_code} from {e.request.url.path}"
+    except httpx.RequestError as e:
+        result.error = f"Network error: {e}"
+
+    result.duration = time.perf_counter() - started
+    result.samples = metrics.samples[first_sample:]
+    logger.debug("Synced account {}: {}", account, result)
+    return result
+
+
+def _sync_in_worker(
+    account: str,
+    credentials: AuthCredentials,
+    store_path: Path,
+    requests_per_second: float | None,
+    since: str | None,
+) -> AccountSyncResult:
+    """Process-pool entry point: collect this worker's request samples."""
+
+    metrics = get_request_metrics()
+    metrics.reset()
+    metrics.enabled = True
+    return sync_account(
+        account,
+        credentials,
+        store_path,
+        requests_per_second=requests_per_second,
+        since=since,
+    )
+
+
+def sync_accounts(
+    ctx: typer.Context,
+    accounts: Annotated[
+        list[str],
+        typer.Option(
+            "--account",
+            "-a",
+            help="Account to sync (repeatable). Defaults to the [auth] account.",
+        ),
+    ] = None,
+    all_accounts: Annotated[
+        bool,
+        typer.Option("--all-accounts", help="Sync every configured account."),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Worker processes for multi-account syncs. Defaults to one per CPU.",
+            min=1,
+        ),
+    ] = None,
+    rate: Annotated[
+        float,
+        typer.Option(
+            "--rate",
+            help="Maximum requests per second per account (0 for unlimited).",
+            min=0,
+        ),
+    ] = 10.0,
+    since: Annotated[
+        str,
+        typer.Option(
+            "--since",
+            help="Fetch entries since this ISO 8601 timestamp instead of the last sync.",
+        ),
+    ] = None,
+) -> None:
+    """Sync subscriptions and entries for one or more accounts into local stores."""
+    state = get_state(ctx)
+    logger.debug("Syncing accounts with log config {}", state.log_config_path)
+    config = get_config()
+    configured = config.all_accounts()
+
+    if all_accounts:
+        selected = list(configured)
+    else:
+        selected = accounts or [DEFAULT_ACCOUNT]
+
+    missing = [name for name in selected if name not in configured]
+    if missing or not selected:
+        typer.echo(
+            f"❌ No credentials for account(s): {', '.join(missing) or DEFAULT_ACCOUNT}. "
+            "Use `feedscope auth login` or `feedscope accounts add` first.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    invalid = [name for name in selected if not is_valid_account_name(name)]
+    if invalid:
+        typer.echo(
+            f"❌ Invalid account name(s): {', '.join(invalid)}. "
+            "Use only letters, digits, '-' and '_'.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    jobs = [
+        (name, configured[name], account_store_path(name), rate or None, since)
+        for name in selected
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    metrics = get_request_metrics()
+    collecting = metrics.enabled
+    metrics.enabled = True
+    results: list[AccountSyncResult] = []
+
+    def report(result: AccountSyncResult) -> None:
+        results.append(result)
+        status = f"❌ {result.error}" if result.error else "✅"
+        typer.echo(
+            f"[{len(results)}/{len(jobs)}] {result.account}: {status} "
+            f"{result.subscriptions} subscriptions, {result.entries} entries, "
+            f"{result.new_revisions} new revisions in {result.duration:.1f}s",
+            err=True,
+        )
+
+    started = time.perf_counter()
+    try:
+        if workers == 1:
+            for job in jobs:
+                report(sync_account(*job[:3], requests_per_second=job[3], since=job[4]))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_sync_in_worker, *job) for job in jobs]
+                for future in as_completed(futures):
+                    result = future.result()
+                    metrics.samples.extend(result.samples)
+                    report(result)
+    finally:
+        if not collecting:
+            metrics.reset()
+        metrics.enabled = collecting
+    elapsed = time.perf_counter() - started
+
+    typer.echo(
+        f"{'account':<20} {'subs':>6} {'entries':>8} {'revs':>6} {'requests':>9} {'bytes':>12} {'seconds':>8}"
+    )
+    for result in sorted(results, key=lambda item: item.account):
+        typer.echo(
+            f"{result.account:<20} {result.subscriptions:>6} {result.entries:>8} "
+            f"{result.new_revisions:>6} {len(result.samples):>9} "
+            f"{sum(sample.bytes for sample in result.samples):>12} {result.duration:>8.1f}"
+        )
+
+    failed = [result for result in results if result.error]
+    typer.echo(
+        f"{'✅' if not failed else '⚠️'} Synced {len(results) - len(failed)}/{len(results)} "
+        f"accounts with {workers} worker(s) in {elapsed:.1f}s",
+        color=typer.colors.GREEN if not failed else typer.colors.YELLOW,
+    )
+    if failed:
+        raise typer.Exit(1)
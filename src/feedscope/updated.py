@@ -0,0 +1,194 @@
+import typer
+import httpx
+from typing_extensions import Annotated
+from loguru import logger
+
+from .config import get_config
+from .client import get_client
+from .output import Compression, CompressionOption, OutputOption, open_output
+from .state import get_state
+from .store import get_store
+from .sync import store_updated_revisions
+
+updated_app = typer.Typer(
+    help="Track entries that were modified after publication",
+    invoke_without_command=True,
+)
+
+
+@updated_app.callback()
+def updated(ctx: typer.Context):
+    """
+    Track entries that were modified after publication.
+    """
+    get_state(ctx)
+    if ctx.invoked_subcommand is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+
+def _fetch_updated_ids(client: httpx.Client, auth: tuple[str, str], since: str | None) -> list[int]:
+    params = {"since": since} if since else None
+    response = client.get(
+        "https://api.feedbin.com/v2/updated_entries.json", params=params, auth=auth
+    )
+    typer.echo(f"Retrieving: {response.request.url}", err=True)
+    if response.status_code != 200:
+        if response.status_code == 401:
+            typer.echo(
+                "❌ Authentication failed. Please run `feedscope auth login` again.",
+                color=typer.colors.RED,
+            )
+        else:
+            typer.echo(
+                f"❌ Unexpected response: {response.status_code}",
+                color=typer.colors.RED,
+            )
+        raise typer.Exit(1)
+    return response.json()
+
+
+@updated_app.command(name="list", help="List the IDs of updated entries.")
+def list_updated(
+    ctx: typer.Context,
+    since: Annotated[
+        str,
+        typer.Option(
+            "--since",
+            help="Only include entries updated after this ISO 8601 timestamp.",
+        ),
+    ] = None,
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
+) -> None:
+    """Retrieves the IDs of updated entries from Feedbin."""
+    state = get_state(ctx)
+    logger.debug("Listing updated entries with log config {}", state.log_config_path)
+    config = get_config()
+
+    if not config.auth.email or not config.auth.password:
+        typer.echo(
+            "❌ Authentication credentials not found. Please run `feedscope auth login` first.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        with get_client() as client:
+            entry_ids = _fetch_updated_ids(
+                client, (config.auth.email, config.auth.password), since
+            )
+    except httpx.RequestError as e:
+        typer.echo(f"❌ Network error: {e}", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    with open_output(output, compress) as writer:
+        for entry_id in entry_ids:
+            writer.write_line(str(entry_id))
+
+
+@updated_app.command(
+    name="sync", help="Store new revisions of updated entries as compact deltas."
+)
+def sync_updated(
+    ctx: typer.Context,
+    since: Annotated[
+        str,
+        typer.Option(
+            "--since",
+            help="Only include entries updated after this ISO 8601 timestamp.",
+        ),
+    ] = None,
+) -> None:
+    """Fetches updated entries and records each changed version in the local store."""
+    state = get_state(ctx)
+    logger.debug("Syncing updated entries with log config {}", state.log_config_path)
+    config = get_config()
+
+    if not config.auth.email or not config.auth.password:
+        typer.echo(
+            "❌ Authentication credentials not found. Please run `feedscope auth login` first.",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    auth = (config.auth.email, config.auth.password)
+
+    try:
+        with get_client() as client, get_store() as store:
+            entry_ids = _fetch_updated_ids(client, auth, since)
+            new_revisions = store_updated_revisions(client, auth, store, entry_ids)
+
+    except httpx.HTTPStatusError as e:
+        typer.echo(
+            f"❌ Unexpected response: {e.response.status_code}",
+            color=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+    except httpx.RequestError as e:
+        typer.echo(f"❌ Network error: {e}", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.echo(
+        f"✅ Synced {len(entry_ids)} updated entries ({new_revisions} new revisions).",
+        color=typer.colors.GREEN,
+    )
+
+
+@updated_app.command(name="revisions", help="List stored revisions of an entry.")
+def list_revisions(
+    ctx: typer.Context,
+    entry_id: Annotated[int, typer.Argument(help="The ID of the entry.")],
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
+) -> None:
+    """Lists the revisions of an entry held in the local store."""
+    state = get_state(ctx)
+    logger.debug("Listing entry revisions with log config {}", state.log_config_path)
+
+    with get_store() as store:
+        revisions = store.entry_revisions(entry_id)
+
+    if not revisions:
+        typer.echo(f"❌ No revisions stored for entry {entry_id}.", color=typer.colors.RED)
+        raise typer.Exit(1)
+
+    with open_output(output, compress) as writer:
+        for info in revisions:
+            writer.write_line(
+                f"[{info.revision}] {info.recorded_at} {info.kind} "
+                f"{info.stored_bytes}B stored / {info.content_length} chars - {info.title}"
+            )
+
+
+@updated_app.command(name="show", help="Show an entry's content at a stored revision.")
+def show_revision(
+    ctx: typer.Context,
+    entry_id: Annotated[int, typer.Argument(help="The ID of the entry.")],
+    revision: Annotated[
+        int,
+        typer.Option(
+            "--revision",
+            "-r",
+            help="Revision number to rebuild. Defaults to the latest.",
+            min=0,
+        ),
+    ] = None,
+    output: OutputOption = None,
+    compress: CompressionOption = Compression.auto,
+) -> None:
+    """Rebuilds an entry's content from the local store."""
+    state = get_state(ctx)
+    logger.debug("Showing entry revision with log config {}", state.log_config_path)
+
+    with get_store() as store:
+        try:
+            content = store.entry_content(entry_id, revision)
+        except KeyError:
+            typer.echo(
+                f"❌ Revision not found for entry {entry_id}.", color=typer.colors.RED
+            )
+            raise typer.Exit(1)
+
+    with open_output(output, compress) as writer:
+        writer.write_line(content)
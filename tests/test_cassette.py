@@ -0,0 +1,140 @@
+"""Tests for cassette recording and offline replay."""
+from pathlib import Path
+import base64
+import os
+
+import httpx
+import pytest
+from platformdirs import user_config_dir
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import app
+from feedscope.cassette import REPLAY_ENV, Cassette, RecordingTransport, ReplayTransport
+
+
+CONFIG_FILE = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+
+runner = CliRunner()
+
+AUTH = ("me@example.com", "hunter2")
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    calls = int(request.url.params.get("n", 0))
+    return httpx.Response(
+        200,
+        json=[{"id": 1, "title": f"Feed {calls}", "feed_url": "https://example.com/feed"}],
+        headers={"Set-Cookie": "session=secret"},
+    )
+
+
+def _record(path: Path, *urls: str) -> None:
+    cassette = Cassette(path)
+    transport = RecordingTransport(cassette, transport=httpx.MockTransport(_handler))
+    with httpx.Client(transport=transport) as client:
+        for url in urls:
+            client.get(url, auth=AUTH)
+
+
+@pytest.fixture
+def credentials() -> None:
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONFIG_FILE.write_text(f'[auth]\nemail = "{AUTH[0]}"\npassword = "{AUTH[1]}"\n')
+
+    yield
+
+    CONFIG_FILE.unlink()
+
+
+def test_recording_scrubs_credentials(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.sqlite3"
+
+    _record(path, "https://api.feedbin.com/v2/subscriptions.json")
+
+    raw = path.read_bytes()
+    assert base64.b64encode(":".join(AUTH).encode()) not in raw
+    assert b"hunter2" not in raw
+    assert b"session=secret" not in raw
+
+
+def test_replay_returns_recordings_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.sqlite3"
+    url = "https://api.feedbin.com/v2/subscriptions.json"
+    cassette = Cassette(path)
+    transport = RecordingTransport(cassette, transport=httpx.MockTransport(_handler))
+    with httpx.Client(transport=transport) as client:
+        client.get(url, params={"n": 1})
+    # Same request, different response: replayed in recording order
+    cassette = Cassette(path)
+    transport = RecordingTransport(
+        cassette,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=["second"])),
+    )
+    with httpx.Client(transport=transport) as client:
+        client.get(url, params={"n": 1})
+
+    with httpx.Client(transport=ReplayTransport(Cassette(path))) as client:
+        assert client.get(url, params={"n": 1}).json()[0]["title"] == "Feed 1"
+        assert client.get(url, params={"n": 1}).json() == ["second"]
+        assert client.get(url, params={"n": 1}).json() == ["second"]
+        with pytest.raises(httpx.ConnectError, match="No recorded response"):
+            client.get(url, params={"n": 2})
+
+
+def test_replay_keeps_accounts_apart(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.sqlite3"
+    url = "https://api.feedbin.com/v2/subscriptions.json"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        user = base64.b64decode(request.headers["authorization"].split()[1]).decode()
+        return httpx.Response(200, json=[{"id": 1, "title": user.split(":")[0]}])
+
+    for user in ("alice@example.com", "bob@example.com"):
+        transport = RecordingTransport(Cassette(path), transport=httpx.MockTransport(handler))
+        with httpx.Client(transport=transport) as client:
+            client.get(url, auth=(user, "secret"))
+
+    assert b"alice@example.com" not in path.read_bytes()
+    # Each client gets a fresh cassette, as get_client() and sync workers do
+    for user in ("bob@example.com", "alice@example.com"):
+        with httpx.Client(transport=ReplayTransport(Cassette(path))) as client:
+            assert client.get(url, auth=(user, "secret")).json()[0]["title"] == user
+    with httpx.Client(transport=ReplayTransport(Cassette(path))) as client:
+        with pytest.raises(httpx.ConnectError):
+            client.get(url, auth=("carol@example.com", "secret"))
+
+
+def test_cli_replays_offline(tmp_path: Path, credentials: None) -> None:
+    path = tmp_path / "cassette.sqlite3"
+    _record(path, "https://api.feedbin.com/v2/subscriptions.json")
+
+    result = runner.invoke(app, ["--replay", str(path), "subscriptions", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert "[1] Feed 0 - https://example.com/feed" in result.stdout
+    assert REPLAY_ENV not in os.environ
+
+
+def test_cli_replay_miss_is_a_network_error(tmp_path: Path, credentials: None) -> None:
+    path = tmp_path / "cassette.sqlite3"
+    _record(path, "https://api.feedbin.com/v2/subscriptions.json")
+
+    result = runner.invoke(app, ["--replay", str(path), "subscriptions", "list", "--extended"])
+
+    assert result.exit_code == 1
+    assert "No recorded response" in result.stdout
+
+
+def test_cli_rejects_record_and_replay(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.sqlite3"
+    _record(path, "https://api.feedbin.com/v2/subscriptions.json")
+
+    result = runner.invoke(
+        app, ["--record", str(tmp_path / "new.sqlite3"), "--replay", str(path), "auth", "whoami"]
+    )
+
+    assert result.exit_code == 1
@@ -0,0 +1,139 @@
+"""Tests for entry export and HTML content transforms."""
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+import json
+import os
+
+import httpx
+import pytest
+from platformdirs import user_config_dir
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import app, entries
+from feedscope.htmltext import FEED_CHUNK_SIZE, TextExtractor, extract
+
+
+CONFIG_FILE = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+
+runner = CliRunner()
+
+# From content/entries.md
+SAMPLE_CONTENT = (
+    '<p><a href="https://twitter.com/bavarious/status/297851496945577984">Bavarious</a> '
+    'created a <a href="https://github.com/bavarious/objc4/commits/master">GitHub repository</a> '
+    "that shows the differences between versions of "
+    '<a href="http://www.opensource.apple.com/source/objc4/">Apple’s Objective-C runtime</a> '
+    "that shipped with different versions of Mac OS X.</p>"
+)
+
+
+@pytest.fixture
+def credentials() -> None:
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONFIG_FILE.write_text('[auth]\nemail = "me@example.com"\npassword = "secret"\n')
+
+    yield
+
+    if CONFIG_FILE.exists():
+        CONFIG_FILE.unlink()
+
+
+def test_extract_text_and_outbound_links() -> None:
+    html = (
+        "<h1>Title</h1><script>track()</script><p>One &amp; two<br>three</p>"
+        '<ul><li><a href="https://blog.example.com/older">Older</a></li>'
+        '<li><a href="mailto:me@example.com">Mail</a> <a href="https://other.org/x">x</a></li></ul>'
+    )
+
+    extracted = extract(html, "https://blog.example.com/post")
+
+    assert extracted.text == "Title\nOne & two\nthree\nOlder\nMail x"
+    assert extracted.links == ["https://other.org/x"]
+    assert extracted.word_count == 7
+    assert extract(None).text == ""
+
+
+def test_extractor_is_incremental() -> None:
+    parser = TextExtractor()
+    for piece in ["<p>spl", "it <a hr", 'ef="https://a.org">wo', "rd</a></p>"]:
+        parser.feed(piece)
+
+    result = parser.result()
+    assert result.text == "split word"
+    assert result.links == ["https://a.org"]
+
+    large = "<p>word</p>" * (FEED_CHUNK_SIZE // 5)
+    assert extract(large).word_count == FEED_CHUNK_SIZE // 5
+
+
+def test_drain_waits_only_for_oldest_page() -> None:
+    futures = [Future() for _ in range(5)]
+    for index in (0, 1, 3):
+        futures[index].set_result([{"id": index}])
+    pending = deque(futures)
+    written = []
+
+    entries._drain(pending, written.extend, max_pending=4)
+
+    # The unfinished third page stops the non-blocking pass; later pages wait
+    assert written == [{"id": 0}, {"id": 1}]
+    assert list(pending) == futures[2:]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("page", 1))
+    batch = [
+        {
+            "id": page * 10 + i,
+            "url": "https://mjtsai.com/blog/post",
+            "content": SAMPLE_CONTENT,
+        }
+        for i in range(3)
+    ]
+    headers = {}
+    if page < 3:
+        headers["Link"] = f'<https://api.feedbin.com/v2/entries.json?page={page + 1}>; rel="next"'
+    return httpx.Response(200, json=batch, headers=headers)
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_export_with_transforms(
+    credentials: None, monkeypatch: pytest.MonkeyPatch, workers: str
+) -> None:
+    monkeypatch.setattr(
+        entries, "get_client", lambda: httpx.Client(transport=httpx.MockTransport(_handler))
+    )
+
+    result = runner.invoke(
+        app,
+        ["entries", "export", "--text", "--links", "--word-count", "--workers", workers, "--limit", "8"],
+    )
+
+    assert result.exit_code == 0, result.output
+    exported = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [entry["id"] for entry in exported] == [10, 11, 12, 20, 21, 22, 30, 31]
+    first = exported[0]
+    assert first["text"].startswith("Bavarious created a GitHub repository")
+    assert first["word_count"] == 24
+    assert first["links"][1] == "https://github.com/bavarious/objc4/commits/master"
+    assert len(first["links"]) == 3
+
+
+def test_export_without_transforms_keeps_entries(
+    credentials: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        entries, "get_client", lambda: httpx.Client(transport=httpx.MockTransport(_handler))
+    )
+
+    result = runner.invoke(app, ["entries", "export"])
+
+    assert result.exit_code == 0, result.output
+    exported = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(exported) == 9
+    assert "text" not in exported[0]
@@ -0,0 +1,99 @@
+"""Tests for request metrics collection and export."""
+from pathlib import Path
+import json
+import os
+
+import httpx
+import pytest
+from platformdirs import user_config_dir
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import app, subscriptions
+from feedscope.metrics import RequestMetrics, endpoint_template, get_request_metrics
+
+
+CONFIG_FILE = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+
+runner = CliRunner()
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json=[{"id": 1, "title": "Feed", "feed_url": "https://example.com/feed"}],
+    )
+
+
+@pytest.fixture
+def mocked_subscriptions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve subscriptions from a mock transport with the metrics hooks attached."""
+
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONFIG_FILE.write_text('[auth]\nemail = "me@example.com"\npassword = "secret"\n')
+    metrics = get_request_metrics()
+    monkeypatch.setattr(
+        subscriptions,
+        "get_client",
+        lambda: httpx.Client(
+            transport=httpx.MockTransport(_handler),
+            event_hooks={"request": [metrics.on_request], "response": [metrics.on_response]},
+        ),
+    )
+
+    yield
+
+    CONFIG_FILE.unlink()
+
+
+def test_endpoint_template_collapses_ids() -> None:
+    assert endpoint_template("/v2/subscriptions/525.json") == "/v2/subscriptions/{id}.json"
+    assert endpoint_template("/v2/feeds/1/entries.json") == "/v2/feeds/{id}/entries.json"
+    assert endpoint_template("/v2/entries.json") == "/v2/entries.json"
+
+
+def test_request_metrics_summary() -> None:
+    metrics = RequestMetrics()
+    client = httpx.Client(
+        transport=httpx.MockTransport(_handler),
+        event_hooks={"request": [metrics.on_request], "response": [metrics.on_response]},
+    )
+
+    with client:
+        client.get("https://api.feedbin.com/v2/subscriptions/1.json")
+        client.get("https://api.feedbin.com/v2/subscriptions/2.json")
+
+    (group,) = metrics.summary()
+    assert group["endpoint"] == "/v2/subscriptions/{id}.json"
+    assert group["count"] == 2
+    assert group["statuses"] == {"200": 2}
+    assert group["cache"] == {"uncached": 2}
+    assert group["bytes"] > 0
+
+
+def test_metrics_out_writes_json(mocked_subscriptions: None, tmp_path: Path) -> None:
+    output = tmp_path / "metrics.json"
+
+    result = runner.invoke(app, ["--metrics-out", str(output), "subscriptions", "list"])
+
+    assert result.exit_code == 0
+    data = json.loads(output.read_text())
+    assert data["requests"] == 1
+    assert data["endpoints"][0]["endpoint"] == "/v2/subscriptions.json"
+
+
+def test_metrics_out_writes_prometheus(mocked_subscriptions: None, tmp_path: Path) -> None:
+    output = tmp_path / "feedscope.prom"
+
+    result = runner.invoke(app, ["--metrics-out", str(output), "subscriptions", "list"])
+
+    assert result.exit_code == 0
+    text = output.read_text()
+    assert (
+        'feedscope_requests_total{method="GET",endpoint="/v2/subscriptions.json",status="200"} 1'
+        in text
+    )
+    assert "# TYPE feedscope_request_duration_seconds summary" in text
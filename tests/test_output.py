@@ -0,0 +1,120 @@
+"""Tests for buffered command output."""
+from pathlib import Path
+import gzip
+import json
+import os
+
+import httpx
+import pytest
+import typer
+from platformdirs import user_config_dir
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import app, subscriptions
+from feedscope.output import Compression, OutputWriter, open_output, resolve_compression
+
+
+CONFIG_FILE = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+
+runner = CliRunner()
+
+SUBSCRIPTIONS = [
+    {"id": sub_id, "title": f"Feed {sub_id}", "feed_url": f"https://example.com/{sub_id}.xml"}
+    for sub_id in range(1, 4)
+]
+
+
+@pytest.fixture
+def mocked_subscriptions(monkeypatch: pytest.MonkeyPatch) -> None:
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONFIG_FILE.write_text('[auth]\nemail = "me@example.com"\npassword = "secret"\n')
+    monkeypatch.setattr(
+        subscriptions,
+        "get_client",
+        lambda: httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=SUBSCRIPTIONS))
+        ),
+    )
+
+    yield
+
+    CONFIG_FILE.unlink()
+
+
+def test_writer_flushes_in_chunks() -> None:
+    chunks: list[str] = []
+    writer = OutputWriter(chunks.append, buffer_size=10)
+
+    for line in ("abcd", "efgh", "ij"):
+        writer.write_line(line)
+    writer.flush()
+
+    assert chunks == ["abcd\nefgh\n", "ij\n"]
+    assert writer.lines == 3
+
+
+def test_resolve_compression_from_suffix() -> None:
+    assert resolve_compression(Path("out.jsonl.gz"), Compression.auto) is Compression.gzip
+    assert resolve_compression(Path("out.jsonl.zst"), Compression.auto) is Compression.zstd
+    assert resolve_compression(Path("out.jsonl"), Compression.auto) is Compression.none
+    assert resolve_compression(Path("out.jsonl"), Compression.gzip) is Compression.gzip
+
+
+def test_failed_output_leaves_no_file(tmp_path: Path) -> None:
+    target = tmp_path / "out.txt"
+
+    with pytest.raises(typer.Exit):
+        with open_output(target) as writer:
+            writer.write_line("partial")
+            raise typer.Exit(1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_subscriptions_list_to_gzip_file(mocked_subscriptions: None, tmp_path: Path) -> None:
+    target = tmp_path / "subscriptions.jsonl.gz"
+
+    result = runner.invoke(app, ["subscriptions", "list", "--jsonl", "--output", str(target)])
+
+    assert result.exit_code == 0
+    with gzip.open(target, "rt", encoding="utf-8") as handle:
+        assert [json.loads(line) for line in handle] == SUBSCRIPTIONS
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_subscriptions_list_to_stdout(mocked_subscriptions: None) -> None:
+    result = runner.invoke(app, ["subscriptions", "list"])
+
+    assert result.exit_code == 0
+    assert "[2] Feed 2 - https://example.com/2.xml" in result.stdout
+
+
+def test_empty_subscriptions_replace_output_file(
+    mocked_subscriptions: None, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        subscriptions,
+        "get_client",
+        lambda: httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        ),
+    )
+    target = tmp_path / "subscriptions.txt"
+    target.write_text("stale\n")
+
+    result = runner.invoke(app, ["subscriptions", "list", "--output", str(target)])
+
+    assert result.exit_code == 0
+    assert "No subscriptions found." in result.stdout
+    assert target.read_text() == ""
+
+
+def test_compression_requires_output_file(mocked_subscriptions: None) -> None:
+    result = runner.invoke(app, ["subscriptions", "list", "--compress", "gzip"])
+
+    assert result.exit_code == 1
+    assert "requires --output" in result.output
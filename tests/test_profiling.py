@@ -0,0 +1,66 @@
+"""Tests for the global --profile option."""
+from pathlib import Path
+import os
+import pstats
+
+import pytest
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import app
+from feedscope.profiling import categorize
+
+
+runner = CliRunner()
+
+
+@pytest.mark.parametrize(
+    ("filename", "function", "expected"),
+    [
+        ("/venv/lib/python3.11/site-packages/httpx/_client.py", "send", "network"),
+        ("~", "<method 'recv_into' of '_socket.socket' objects>", "network"),
+        ("/usr/lib/python3.11/json/decoder.py", "decode", "json"),
+        ("/venv/lib/python3.11/site-packages/rich/console.py", "print", "output"),
+        ("/venv/lib/python3.11/site-packages/tomlkit/api.py", "parse", "config"),
+        ("/src/feedscope/subscriptions.py", "list_subscriptions", "other"),
+    ],
+)
+def test_categorize(filename: str, function: str, expected: str) -> None:
+    assert categorize(filename, function) == expected
+
+
+def test_profile_cprofile_writes_pstats(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["--profile", "cprofile", "--profile-dir", str(tmp_path), "config", "location"]
+    )
+
+    assert result.exit_code == 0
+    (artifact,) = tmp_path.glob("*.pstats")
+    assert pstats.Stats(str(artifact)).total_calls > 0
+    assert "cprofile profile written to" in result.output
+
+
+def test_profile_tracemalloc_writes_report(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["--profile", "tracemalloc", "--profile-dir", str(tmp_path), "config", "location"]
+    )
+
+    assert result.exit_code == 0
+    (artifact,) = tmp_path.glob("*.allocations.txt")
+    assert "peak" in artifact.read_text()
+
+
+def test_profile_wall_writes_collapsed_stacks(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["--profile", "wall", "--profile-dir", str(tmp_path), "config", "location"]
+    )
+
+    assert result.exit_code == 0
+    (artifact,) = tmp_path.glob("*.collapsed")
+    for line in artifact.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+    assert "wall profile written to" in result.output
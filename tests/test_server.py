@@ -0,0 +1,202 @@
+"""Tests for the local query server."""
+from pathlib import Path
+import asyncio
+import os
+
+import httpx
+import pytest
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import sync
+from feedscope.config import AuthCredentials
+from feedscope.server import QueryApp, Refresher, ResponseCache, _start_server
+from feedscope.store import FeedscopeStore
+
+
+@pytest.fixture
+def store_path(tmp_path: Path) -> Path:
+    path = tmp_path / "feedscope.sqlite3"
+    with FeedscopeStore(path) as store:
+        store.replace_subscriptions(
+            [{"id": 1, "feed_id": 10, "title": "Alpha"}, {"id": 2, "feed_id": 20, "title": "Beta"}]
+        )
+        store.upsert_entries(
+            [
+                {
+                    "id": entry_id,
+                    "feed_id": 10 if entry_id % 2 else 20,
+                    "title": f"Entry {entry_id}",
+                    "published": f"2025-01-{entry_id:02d}T00:00:00.000000Z",
+                }
+                for entry_id in range(1, 8)
+            ]
+        )
+    return path
+
+
+def _get(app: QueryApp, *requests: tuple[str, dict]) -> list[httpx.Response]:
+    async def run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://feedscope") as client:
+            return [await client.get(url, headers=headers) for url, headers in requests]
+
+    return asyncio.run(run())
+
+
+def test_entries_filtering_and_paging(store_path: Path) -> None:
+    app = QueryApp(store_path)
+
+    first, second = _get(
+        app,
+        ("/entries.json?feed_id=10&per_page=2", {}),
+        ("/entries.json?feed_id=10&per_page=2&page=2", {}),
+    )
+
+    assert [entry["id"] for entry in first.json()] == [7, 5]
+    assert first.headers["x-total-count"] == "4"
+    assert first.links["next"]["url"] == "/entries.json?feed_id=10&per_page=2&page=2"
+    assert [entry["id"] for entry in second.json()] == [3, 1]
+    assert "next" not in second.links
+
+    (since,) = _get(app, ("/entries.json?since=2025-01-06&q=Entry", {}))
+    assert [entry["id"] for entry in since.json()] == [7, 6]
+
+
+def test_etags_and_documents(store_path: Path) -> None:
+    app = QueryApp(store_path)
+
+    listing, detail, missing, bad = _get(
+        app,
+        ("/subscriptions.json", {}),
+        ("/subscriptions/2.json", {}),
+        ("/entries/99.json", {}),
+        ("/entries.json?per_page=0", {}),
+    )
+    assert [sub["title"] for sub in listing.json()] == ["Alpha", "Beta"]
+    assert detail.json()["title"] == "Beta"
+    assert missing.status_code == 404
+    assert bad.status_code == 400
+
+    (unchanged,) = _get(app, ("/subscriptions.json", {"If-None-Match": listing.headers["etag"]}))
+    assert unchanged.status_code == 304
+
+    # A write from another connection invalidates cached responses
+    with FeedscopeStore(store_path) as store:
+        store.replace_subscriptions([{"id": 3, "title": "Gamma"}])
+    (changed,) = _get(app, ("/subscriptions.json", {"If-None-Match": listing.headers["etag"]}))
+    assert changed.status_code == 200
+    assert [sub["title"] for sub in changed.json()] == ["Gamma"]
+
+
+def test_response_cache_is_bounded() -> None:
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+
+    cache.put("a", ("", b"1234", []))
+    cache.put("b", ("", b"1234", []))
+    cache.get("a")
+    cache.put("c", ("", b"1234", []))
+    # "a" was used more recently than "b", so "b" is evicted
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    cache.put("d", ("", b"123456789", []))
+    assert len(cache) == 1 and cache.size == 9
+    cache.put("huge", ("", b"x" * 11, []))
+    assert cache.get("huge") is None
+
+
+def test_random_queries_do_not_grow_cache(store_path: Path) -> None:
+    app = QueryApp(store_path)
+    app._cache.max_entries = 8
+
+    responses = _get(app, *[(f"/entries.json?q=missing{n}", {}) for n in range(20)])
+
+    assert {response.status_code for response in responses} == {200}
+    assert len(app._cache) == 8
+
+
+def test_builtin_server_keeps_connections_alive(store_path: Path) -> None:
+    app = QueryApp(store_path)
+
+    async def run() -> list[httpx.Response]:
+        server = await _start_server(app, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as client:
+                return [await client.get("/subscriptions/1.json") for _ in range(2)]
+
+    responses = asyncio.run(run())
+    assert [response.json()["title"] for response in responses] == ["Alpha", "Alpha"]
+
+
+def _raw(app: QueryApp, request: bytes) -> bytes:
+    """Send raw bytes to the built-in server and read until it closes."""
+
+    async def run() -> bytes:
+        server = await _start_server(app, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return response
+
+    return asyncio.run(run())
+
+
+def test_builtin_server_closes_after_request_body(store_path: Path) -> None:
+    app = QueryApp(store_path)
+    smuggled = b"GET /subscriptions/2.json HTTP/1.1\r\nHost: feedscope\r\n\r\n"
+
+    response = _raw(
+        app,
+        b"POST /subscriptions.json HTTP/1.1\r\nHost: feedscope\r\n"
+        + f"Content-Length: {len(smuggled)}\r\n\r\n".encode()
+        + smuggled,
+    )
+
+    # The body is not parsed as a second request
+    assert response.startswith(b"HTTP/1.1 405 ")
+    assert response.count(b"HTTP/1.1 ") == 1
+    assert b"connection: close" in response
+
+
+def test_builtin_server_decodes_paths(store_path: Path) -> None:
+    app = QueryApp(store_path)
+
+    response = _raw(
+        app, b"GET /subscriptions/%31.json HTTP/1.1\r\nHost: feedscope\r\nConnection: close\r\n\r\n"
+    )
+
+    assert response.startswith(b"HTTP/1.1 200 ")
+    assert b'"Alpha"' in response
+
+
+def test_background_refresh_uses_sync(store_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/subscriptions.json"):
+            return httpx.Response(200, json=[{"id": 5, "title": "Fresh"}])
+        return httpx.Response(200, json=[])
+
+    monkeypatch.setattr(
+        sync,
+        "get_client",
+        lambda requests_per_second=None: httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    refresher = Refresher(
+        "default", AuthCredentials(email="me@example.com", password="secret"), store_path, interval=60
+    )
+    app = QueryApp(store_path, refresher)
+    refresher.start()
+    refresher.stop()
+    refresher.join(5)
+
+    listing, status = _get(app, ("/subscriptions.json", {}), ("/status.json", {}))
+    assert [sub["title"] for sub in listing.json()] == ["Fresh"]
+    assert status.json()["last_refresh"] is not None
+    assert status.json()["last_refresh_error"] is None
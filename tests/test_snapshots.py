@@ -0,0 +1,93 @@
+"""Tests for compact ID-set snapshots and their deltas."""
+from pathlib import Path
+import json
+import os
+
+import httpx
+import pytest
+from platformdirs import user_config_dir
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import app, snapshots
+from feedscope.idsets import decode_ids, diff_ids, encode_ids
+
+
+CONFIG_FILE = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the local store at a temporary data directory."""
+
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+
+
+@pytest.fixture
+def credentials() -> None:
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONFIG_FILE.write_text('[auth]\nemail = "me@example.com"\npassword = "secret"\n')
+
+    yield
+
+    if CONFIG_FILE.exists():
+        CONFIG_FILE.unlink()
+
+
+def test_id_set_round_trip_is_compact() -> None:
+    ids = list(range(4_000_000_000, 4_000_050_000, 2))
+
+    payload = encode_ids(reversed(ids + ids[:10]))
+
+    assert list(decode_ids(payload)) == ids
+    assert len(payload) < len(ids)
+    assert list(decode_ids(encode_ids([]))) == []
+
+
+def test_diff_ids() -> None:
+    assert diff_ids([1, 2, 3, 5], [2, 3, 4, 6]) == ([4, 6], [1, 5])
+    assert diff_ids([], [1, 2]) == ([1, 2], [])
+    assert diff_ids([9, 7, 7], decode_ids(encode_ids([8, 7]))) == ([8], [9])
+
+
+def test_take_emits_only_deltas(credentials: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = {"unread_entries": [[1, 2, 3], [2, 3, 4], [2, 3, 4]], "starred_entries": [[9]] * 3}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1].removesuffix(".json")
+        return httpx.Response(200, json=responses[name].pop(0))
+
+    monkeypatch.setattr(
+        snapshots, "get_client", lambda: httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    deltas = []
+    for _ in range(3):
+        result = runner.invoke(app, ["snapshots", "take", "unread", "starred"])
+        assert result.exit_code == 0, result.output
+        deltas.append([json.loads(line) for line in result.stdout.splitlines()])
+
+    first, second, third = deltas
+    assert first[0]["added"] == [1, 2, 3] and first[0]["previous"] is None
+    assert (second[0]["added"], second[0]["removed"]) == ([4], [1])
+    assert (second[1]["added"], second[1]["removed"]) == ([], [])
+    assert third[0]["count"] == 3 and third[0]["added"] == third[0]["removed"] == []
+
+    # Unchanged sets are not stored again
+    listing = runner.invoke(app, ["snapshots", "list"]).stdout.splitlines()
+    assert [line.split()[0] for line in listing] == ["starred", "unread", "unread"]
+
+    result = runner.invoke(app, ["snapshots", "ids", "unread"])
+    assert result.stdout.split() == ["2", "3", "4"]
+
+
+def test_ids_without_snapshot() -> None:
+    result = runner.invoke(app, ["snapshots", "ids", "recently-read"])
+
+    assert result.exit_code == 1
+    assert "No recently-read snapshot stored" in result.stdout
@@ -0,0 +1,186 @@
+"""Tests for multi-account configuration and sync."""
+from pathlib import Path
+import base64
+import multiprocessing
+import os
+import sqlite3
+
+import httpx
+import pytest
+import tomlkit
+from platformdirs import user_config_dir
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import accounts, app, sync
+from feedscope.metrics import get_request_metrics
+from feedscope.store import account_store_path
+
+
+CONFIG_FILE = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+
+runner = CliRunner()
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    user = base64.b64decode(request.headers["authorization"].split()[1]).decode()
+    path = request.url.path
+    if path == "/v2/authentication.json":
+        return httpx.Response(200)
+    if user.startswith("broken@"):
+        return httpx.Response(500)
+    if path == "/v2/subscriptions.json":
+        return httpx.Response(200, json=[{"id": 1, "feed_id": 10, "title": "Feed"}])
+    if path == "/v2/entries.json" and "ids" in request.url.params:
+        return httpx.Response(200, json=[{"id": 5, "content": "<p>new</p>", "original": {"content": "<p>old</p>"}}])
+    if path == "/v2/entries.json" and request.url.params.get("page") == "2":
+        return httpx.Response(200, json=[{"id": 4, "feed_id": 10, "title": "Older"}])
+    if path == "/v2/entries.json":
+        return httpx.Response(
+            200,
+            json=[{"id": 5, "feed_id": 10, "title": "Newer"}],
+            headers={"Link": '<https://api.feedbin.com/v2/entries.json?page=2>; rel="next"'},
+        )
+    if path == "/v2/updated_entries.json":
+        return httpx.Response(200, json=[5])
+    return httpx.Response(404)
+
+
+def _mock_client(requests_per_second: float | None = None) -> httpx.Client:
+    metrics = get_request_metrics()
+    return httpx.Client(
+        transport=httpx.MockTransport(_handler),
+        event_hooks={"request": [metrics.on_request], "response": [metrics.on_response]},
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setattr(sync, "get_client", _mock_client)
+    monkeypatch.setattr(accounts, "get_client", _mock_client)
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONFIG_FILE.write_text(
+        '[auth]\nemail = "me@example.com"\npassword = "secret"\n\n'
+        '[accounts.work]\nemail = "work@example.com"\npassword = "secret"\n'
+    )
+
+    yield
+
+    CONFIG_FILE.unlink()
+
+
+def test_accounts_add_list_remove() -> None:
+    result = runner.invoke(app, ["accounts", "add", "team", "team@example.com", "-p", "pw"])
+    assert result.exit_code == 0
+
+    doc = tomlkit.parse(CONFIG_FILE.read_text())
+    assert doc["accounts"]["team"]["email"] == "team@example.com"
+    assert doc["auth"]["email"] == "me@example.com"
+
+    result = runner.invoke(app, ["accounts", "list"])
+    assert result.stdout.splitlines() == [
+        "default: me@example.com",
+        "work: work@example.com",
+        "team: team@example.com",
+    ]
+
+    result = runner.invoke(app, ["accounts", "remove", "team"])
+    assert result.exit_code == 0
+    assert "team" not in tomlkit.parse(CONFIG_FILE.read_text())["accounts"]
+
+
+@pytest.mark.parametrize("name", ["../../evil", "a/b", "", "with space", "evil\n"])
+def test_accounts_reject_unsafe_names(name: str) -> None:
+    result = runner.invoke(app, ["accounts", "add", name, "x@example.com", "-p", "pw"])
+
+    assert result.exit_code == 1
+    assert "Invalid account name" in result.stdout
+    assert "accounts." not in CONFIG_FILE.read_text().replace("accounts.work", "")
+    with pytest.raises(ValueError):
+        account_store_path(name)
+
+
+def test_sync_rejects_unsafe_configured_name() -> None:
+    CONFIG_FILE.write_text(
+        CONFIG_FILE.read_text()
+        + '\n[accounts."../evil"]\nemail = "evil@example.com"\npassword = "secret"\n'
+    )
+
+    result = runner.invoke(app, ["sync", "--all-accounts", "--workers", "1"])
+
+    assert result.exit_code == 1
+    assert "Invalid account name(s): ../evil" in result.stdout
+
+
+def test_sync_all_accounts_into_separate_stores() -> None:
+    result = runner.invoke(app, ["sync", "--all-accounts", "--workers", "1", "--rate", "0"])
+
+    assert result.exit_code == 0, result.output
+    assert "Synced 2/2 accounts" in result.stdout
+    for name in ("default", "work"):
+        path = account_store_path(name)
+        assert path.exists()
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM entries").fetchone() == (2,)
+            assert connection.execute("SELECT COUNT(*) FROM subscriptions").fetchone() == (1,)
+            assert connection.execute("SELECT COUNT(*) FROM entry_revisions").fetchone() == (2,)
+    assert account_store_path("default") != account_store_path("work")
+
+
+def test_sync_reports_failed_account() -> None:
+    CONFIG_FILE.write_text(
+        CONFIG_FILE.read_text()
+        + '\n[accounts.broken]\nemail = "broken@example.com"\npassword = "secret"\n'
+    )
+
+    result = runner.invoke(app, ["sync", "-a", "work", "-a", "broken", "--workers", "1"])
+
+    assert result.exit_code == 1
+    assert "Synced 1/2 accounts" in result.stdout
+    assert "HTTP 500" in result.output
+
+
+def test_sync_unknown_account() -> None:
+    result = runner.invoke(app, ["sync", "--account", "nobody"])
+
+    assert result.exit_code == 1
+    assert "No credentials for account(s): nobody" in result.stdout
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="mocked client only reaches forked workers",
+)
+def test_sync_fans_out_to_worker_processes() -> None:
+    result = runner.invoke(app, ["sync", "--all-accounts", "--workers", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert "Synced 2/2 accounts with 2 worker(s)" in result.stdout
+    assert account_store_path("work").exists()
+
+
+def test_worker_returns_request_samples(tmp_path: Path) -> None:
+    config = sync.get_config()
+    metrics = get_request_metrics()
+
+    try:
+        result = sync._sync_in_worker(
+            "work", config.accounts["work"], tmp_path / "work.sqlite3", None, None
+        )
+    finally:
+        metrics.reset()
+        metrics.enabled = False
+
+    assert result.error is None
+    assert result.entries == 2
+    assert [sample.endpoint for sample in result.samples] == [
+        "/v2/subscriptions.json",
+        "/v2/entries.json",
+        "/v2/entries.json",
+        "/v2/updated_entries.json",
+        "/v2/entries.json",
+    ]
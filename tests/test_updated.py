@@ -0,0 +1,147 @@
+"""Tests for updated-entry revision storage."""
+from pathlib import Path
+import os
+import time
+
+import httpx
+import pytest
+from platformdirs import user_config_dir
+from typer.testing import CliRunner
+
+TEST_CONFIG_HOME = Path(__file__).parent / "_config_home"
+TEST_CONFIG_HOME.mkdir(parents=True, exist_ok=True)
+os.environ["XDG_CONFIG_HOME"] = str(TEST_CONFIG_HOME)
+
+from feedscope import app, updated
+from feedscope.deltas import apply_delta, compute_delta
+from feedscope.store import KEYFRAME_INTERVAL, FeedscopeStore
+
+
+CONFIG_FILE = Path(user_config_dir("dev.pirateninja.feedscope")) / "config.toml"
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the local store at a temporary data directory."""
+
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+
+
+@pytest.fixture
+def credentials() -> None:
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONFIG_FILE.write_text('[auth]\nemail = "me@example.com"\npassword = "secret"\n')
+
+    yield
+
+    if CONFIG_FILE.exists():
+        CONFIG_FILE.unlink()
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ("", "<p>hello</p>"),
+        ("<p>hello</p>", ""),
+        ("<p>a b c</p>\n<p>d</p>", "<p>a B c</p>\n<p>d</p>\n<p>e</p>"),
+        ("x < y and <b>bold", "x <= y and <b>bolder</b>"),
+    ],
+)
+def test_delta_round_trip(old: str, new: str) -> None:
+    """Applying a computed delta to the old text should yield the new text."""
+
+    assert apply_delta(old, compute_delta(old, new)) == new
+
+
+@pytest.mark.parametrize("repetitive", [True, False])
+def test_delta_on_large_article_is_fast(repetitive: bool) -> None:
+    """Large, repetitive articles edited throughout should not go quadratic."""
+
+    lines = [
+        "<p>Lorem ipsum dolor sit amet, <a href='https://x.org'>consectetur</a> elit.</p>\n"
+        if repetitive
+        else f"<p>Paragraph {i} says something new about topic {i * 7 % 13} and more.</p>\n"
+        for i in range(2000)
+    ]
+    old = "".join(lines)
+    new = "".join(
+        line.replace("dolor", "DOLOR").replace("says", "said") if i % 3 == 0 else line
+        for i, line in enumerate(lines)
+    )
+
+    started = time.perf_counter()
+    delta = compute_delta(old, new)
+    elapsed = time.perf_counter() - started
+
+    assert len(old) > 100_000
+    assert apply_delta(old, delta) == new
+    assert elapsed < 2
+
+
+def test_store_rebuilds_every_revision(tmp_path: Path) -> None:
+    """Each stored revision should be reconstructible, across keyframes."""
+
+    versions = [f"<p>intro</p>\n<p>paragraph {i}</p>\n<p>outro</p>" for i in range(KEYFRAME_INTERVAL + 3)]
+
+    with FeedscopeStore(tmp_path / "store.sqlite3") as store:
+        for version in versions:
+            store.record_entry_revision(7, version)
+
+        assert store.record_entry_revision(7, versions[-1]) is None
+        assert [info.revision for info in store.entry_revisions(7)] == list(range(len(versions)))
+        for revision, version in enumerate(versions):
+            assert store.entry_content(7, revision) == version
+        assert store.entry_content(7) == versions[-1]
+
+        kinds = {info.revision: info.kind for info in store.entry_revisions(7)}
+        assert kinds[0] == kinds[KEYFRAME_INTERVAL] == "full"
+        assert kinds[1] == "delta"
+
+
+def test_updated_sync_stores_original_and_latest(
+    credentials: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Sync should record the original then the updated content of an entry."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v2/updated_entries.json":
+            return httpx.Response(200, json=[42])
+        assert request.url.params["ids"] == "42"
+        return httpx.Response(
+            200,
+            json=[
+                {
+                    "id": 42,
+                    "title": "Post",
+                    "url": "https://example.com/post",
+                    "content": "<p>Hello world</p><p>Update</p>",
+                    "original": {"title": "Post", "content": "<p>Hello world</p>"},
+                }
+            ],
+        )
+
+    monkeypatch.setattr(
+        updated, "get_client", lambda: httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    result = runner.invoke(app, ["updated", "sync"])
+    assert result.exit_code == 0
+    assert "1 new revisions" in result.stdout
+
+    result = runner.invoke(app, ["updated", "show", "42", "--revision", "0"])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == "<p>Hello world</p>"
+
+    result = runner.invoke(app, ["updated", "show", "42"])
+    assert result.stdout.strip() == "<p>Hello world</p><p>Update</p>"
+
+
+def test_updated_show_missing_entry() -> None:
+    """Showing an unknown entry should fail cleanly."""
+
+    result = runner.invoke(app, ["updated", "show", "1"])
+
+    assert result.exit_code == 1
+    assert "Revision not found" in result.stdout